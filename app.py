@@ -4,6 +4,9 @@ Provides a modern web-based UI for the web scraping functionality.
 """
 
 from flask import Flask, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
 from web_scraper import (
     search_text_by_keyword,
     search_image_by_keyword,
@@ -12,19 +15,137 @@ from web_scraper import (
     scrape_result_list,
     ai_scrape_topic,
     ai_scrape_result_list,
-    list_all_images
+    list_all_images,
+    set_http_session,
+    create_http_session
 )
-import json
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import orjson
 import os
-from datetime import datetime
+import re
+import stat
+import threading
+import time
+import uuid
+
+
+def _default(obj):
+    """Fallback for objects orjson cannot encode natively (e.g. parsed tags)."""
+    if hasattr(obj, '__dict__'):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that decodes request bodies and encodes jsonify() output with orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
-app.config['JSON_AS_ASCII'] = False  # Support UTF-8 characters
+app.json = OrjsonProvider(app)
+# Let nginx/apache stream downloads via X-Sendfile when deployed behind one
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE') == '1'
+# Compress JSON responses (brotli preferred, gzip fallback)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+# Streamed responses too; Flask-Compress leaves gzip out of its streaming default
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+Compress(app)
+
+# One pooled HTTP session shared by every scrape, so TLS connections to a host are reused
+http_session = create_http_session(pool_connections=20, pool_maxsize=100)
+app.extensions['http_session'] = http_session
+set_http_session(http_session)
 
 # Create downloads directory if it doesn't exist
-downloads_dir = os.path.join(os.path.dirname(__file__), 'downloads')
+downloads_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'downloads')
 os.makedirs(downloads_dir, exist_ok=True)
 
+# Background job state lives on disk so every gunicorn worker can answer a poll
+jobs_dir = os.path.join(downloads_dir, 'jobs')
+os.makedirs(jobs_dir, exist_ok=True)
+
+# orjson always emits UTF-8, so say so explicitly on the responses we build by hand
+_JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+
+# Exports with more items than this are streamed to disk in slices
+_EXPORT_STREAM_THRESHOLD = 10_000
+_EXPORT_CHUNK_ITEMS = 1000
+_EXPORT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Scrape responses with more items than this are streamed instead of buffered
+_STREAM_RESPONSE_THRESHOLD = 10_000
+
+# Characters that are not allowed in exported filenames
+_FILENAME_STRIP_RE = re.compile(r'[^\w .-]+')
+
+# Recent successful scrape responses, keyed by (url, type, options)
+_scrape_cache = TTLCache(maxsize=512, ttl=300)
+_scrape_cache_lock = threading.Lock()
+
+# Background scrape jobs, polled via /api/scrape/jobs/<job_id>
+_job_executor = ThreadPoolExecutor(max_workers=int(os.getenv('SCRAPE_WORKERS', '4')))
+_JOB_ID_RE = re.compile(r'[0-9a-f]{32}')
+_JOB_TTL = 3600
+# Expired job files are swept at most this often (seconds)
+_JOB_SWEEP_INTERVAL = 300
+_last_job_sweep = 0.0
+_job_sweep_lock = threading.Lock()
+
+
+def _json_response(body, status=200):
+    """Build a JSON response encoded with orjson (already encoded bytes are sent as-is)."""
+    if not isinstance(body, bytes):
+        body = orjson.dumps(body, default=_default)
+    return app.response_class(body, status=status, content_type=_JSON_CONTENT_TYPE)
+
+
+def _iter_scrape_body(body):
+    """Yield a successful scrape response body as JSON, encoding one data item at a time."""
+    yield b'{"success":true,"data":['
+    for idx, item in enumerate(body['data']):
+        if idx:
+            yield b','
+        yield orjson.dumps(item, default=_default)
+    yield b'],"message":' + orjson.dumps(body['message']) + b'}'
+
+
+def _write_json_file(filepath, data):
+    """
+    Serialize data to disk as JSON.
+    
+    Normal payloads are encoded to a bytes buffer and written in a single call.
+    Lists longer than _EXPORT_STREAM_THRESHOLD are encoded in slices so the
+    full payload is never held in memory, and the kernel is told not to keep
+    the written pages cached. Both paths write the same 2-space-indented JSON.
+    """
+    with open(filepath, 'wb', buffering=1024 * 1024) as f:
+        if isinstance(data, list) and len(data) > _EXPORT_STREAM_THRESHOLD:
+            f.write(b'[\n')
+            for start in range(0, len(data), _EXPORT_CHUNK_ITEMS):
+                if start:
+                    f.write(b',\n')
+                # Indent each item one level deeper, as it would be inside the indented list
+                f.write(b',\n'.join(
+                    b'  ' + orjson.dumps(item, default=_default, option=_EXPORT_JSON_OPTIONS).replace(b'\n', b'\n  ')
+                    for item in data[start:start + _EXPORT_CHUNK_ITEMS]
+                ))
+            f.write(b'\n]')
+            f.flush()
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        else:
+            f.write(orjson.dumps(data, default=_default, option=_EXPORT_JSON_OPTIONS))
+
 
 @app.route('/')
 def index():
@@ -32,121 +153,246 @@ def index():
     return render_template('index.html')
 
 
+# (scrape type, method) -> (required option, error when it is missing, scraper(url, option value))
+_SCRAPERS = {
+    ('text', 'keyword'): ('keyword', 'Keyword is required', search_text_by_keyword),
+    # ai_scrape_result_list handles both result lists and plain text; the API key comes from config.py
+    ('text', 'ai'): ('topic_query', 'Topic query is required', lambda url, query: ai_scrape_result_list(url, query, None)),
+    ('image', 'keyword'): ('keyword', 'Keyword is required', search_image_by_keyword),
+    ('image', 'list_all'): (None, None, lambda url, _: list_all_images(url)),
+    ('link', 'keyword'): ('keyword', 'Keyword is required', search_link_by_keyword),
+    # Auto-detection, no selector needed
+    ('card', None): (None, None, lambda url, _: scrape_card_results(url, None)),
+}
+
+# Method used when the request doesn't pick one; only text and image let the client choose
+_DEFAULT_METHODS = {'text': 'keyword', 'image': 'keyword', 'link': 'keyword', 'card': None}
+_SELECTABLE_METHOD_TYPES = frozenset({'text', 'image'})
+
+
+def run_scrape(url, scrape_type, options):
+    """
+    Run a scrape and build its JSON response body.
+    
+    Args:
+        url (str): The URL to scrape (already normalized)
+        scrape_type (str): One of 'text', 'image', 'link' or 'card'
+        options (dict): Type-specific options from the request
+        
+    Returns:
+        tuple: (response body dict, HTTP status code)
+    """
+    if scrape_type not in _DEFAULT_METHODS:
+        return {'error': 'Invalid scrape type'}, 400
+    
+    method = _DEFAULT_METHODS[scrape_type]
+    if scrape_type in _SELECTABLE_METHOD_TYPES:
+        method = options.get('method', method)
+    
+    result = None
+    scraper = _SCRAPERS.get((scrape_type, method))
+    if scraper:
+        option_name, missing_error, scrape_fn = scraper
+        value = options.get(option_name, '') if option_name else None
+        if option_name and not value:
+            return {'error': missing_error}, 400
+        result = scrape_fn(url, value)
+    
+    # Format result for JSON response
+    if isinstance(result, str):
+        if result.startswith('Error:') or result.startswith('Not found'):
+            return {
+                'success': False,
+                'error': result,
+                'data': None
+            }, 200
+        # If it's a string but not an error, treat it as a single result
+        result = [result]
+    
+    # Handle different result types
+    if result is None:
+        return {
+            'success': False,
+            'error': 'No data extracted',
+            'data': None
+        }, 200
+    
+    # Convert result to list if it's a single item
+    if not isinstance(result, list):
+        if isinstance(result, dict):
+            # Single card or result item
+            result = [result]
+        else:
+            # Should already be handled above for strings, but handle other types
+            result = [result]
+    
+    item_count = len(result) if isinstance(result, list) else 1
+    return {
+        'success': True,
+        'data': result,
+        'message': f'Successfully extracted {item_count} item(s)'
+    }, 200
+
+
+def _parse_scrape_request(data):
+    """Extract (url, scrape_type, options) from a scrape request body; url is '' if missing."""
+    url = data.get('url', '').strip()
+    scrape_type = data.get('type', '')
+    options = data.get('options', {})
+    
+    # Add https:// if not present
+    if url and not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    return url, scrape_type, options
+
+
+def _job_path(job_id):
+    """Path of a job's state file under downloads/jobs/."""
+    return os.path.join(jobs_dir, f'{job_id}.json')
+
+
+def _save_job(job_id, status, result=None, filename=None):
+    """
+    Write a job's state as its poll response body.
+    
+    The file is written under a temporary name and renamed into place, so
+    readers in other threads or worker processes never see a partial file.
+    """
+    path = _job_path(job_id)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps({
+            'job_id': job_id,
+            'status': status,
+            'data': result,
+            'filename': filename
+        }, default=_default))
+    os.replace(tmp_path, path)
+
+
+def _load_job(job_id):
+    """Return a job's poll response body as JSON bytes, or None if it is unknown or expired."""
+    if not _JOB_ID_RE.fullmatch(job_id):
+        return None
+    path = _job_path(job_id)
+    try:
+        if os.stat(path).st_mtime < time.time() - _JOB_TTL:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _sweep_expired_jobs():
+    """Delete job state files and their job_<id>.json results once they outlive _JOB_TTL."""
+    global _last_job_sweep
+    now = time.time()
+    with _job_sweep_lock:
+        if now - _last_job_sweep < _JOB_SWEEP_INTERVAL:
+            return
+        _last_job_sweep = now
+    
+    cutoff = now - _JOB_TTL
+    with os.scandir(jobs_dir) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime >= cutoff:
+                    continue
+                os.remove(entry.path)
+                if entry.name.endswith('.json'):
+                    os.remove(os.path.join(downloads_dir, f'job_{entry.name}'))
+            except FileNotFoundError:
+                pass
+
+
+def _run_scrape_job(job_id, url, scrape_type, options):
+    """Background worker: run the scrape and persist the response body under downloads/."""
+    if not os.path.exists(_job_path(job_id)):
+        # Swept before a worker picked it up; nobody can poll it any more
+        return
+    _save_job(job_id, 'running')
+    try:
+        body, status = run_scrape(url, scrape_type, options)
+        filename = None
+        if status == 200 and body.get('success'):
+            filename = f'job_{job_id}.json'
+            _write_json_file(os.path.join(downloads_dir, filename), body['data'])
+        _save_job(job_id, 'finished' if status == 200 else 'failed', body, filename)
+    except Exception as e:
+        _save_job(job_id, 'failed', {'success': False, 'error': str(e), 'data': None})
+
+
 @app.route('/api/scrape', methods=['POST'])
 def scrape():
     """API endpoint for scraping."""
     try:
-        data = request.get_json()
-        url = data.get('url', '').strip()
-        scrape_type = data.get('type', '')
-        options = data.get('options', {})
+        url, scrape_type, options = _parse_scrape_request(request.get_json())
         
         if not url:
-            return jsonify({'error': 'URL is required'}), 400
-        
-        # Add https:// if not present
-        if not url.startswith('http://') and not url.startswith('https://'):
-            url = 'https://' + url
-        
-        result = None
-        message = ''
-        
-        if scrape_type == 'text':
-            method = options.get('method', 'keyword')
-            if method == 'keyword':
-                keyword = options.get('keyword', '')
-                if keyword:
-                    result = search_text_by_keyword(url, keyword)
-                else:
-                    return jsonify({'error': 'Keyword is required'}), 400
-            elif method == 'ai':
-                topic_query = options.get('topic_query', '')
-                if topic_query:
-                    # Use ai_scrape_result_list which can handle both result lists and text extraction
-                    # API key will be loaded from config.py automatically (pass None)
-                    result = ai_scrape_result_list(url, topic_query, None)
-                else:
-                    return jsonify({'error': 'Topic query is required'}), 400
-        
-        elif scrape_type == 'image':
-            method = options.get('method', 'keyword')
-            if method == 'keyword':
-                keyword = options.get('keyword', '')
-                if keyword:
-                    result = search_image_by_keyword(url, keyword)
-                else:
-                    return jsonify({'error': 'Keyword is required'}), 400
-            elif method == 'list_all':
-                result = list_all_images(url)
-        
-        elif scrape_type == 'link':
-            keyword = options.get('keyword', '')
-            if keyword:
-                result = search_link_by_keyword(url, keyword)
-            else:
-                return jsonify({'error': 'Keyword is required'}), 400
-        
-        elif scrape_type == 'card':
-            # Auto-detection, no selector needed - always pass None
-            result = scrape_card_results(url, None)
-        
-        else:
-            return jsonify({'error': 'Invalid scrape type'}), 400
+            return _json_response({'error': 'URL is required'}, 400)
         
-        # Format result for JSON response
-        if isinstance(result, str):
-            if result.startswith('Error:') or result.startswith('Not found'):
-                return jsonify({
-                    'success': False,
-                    'error': result,
-                    'data': None
-                })
-            # If it's a string but not an error, treat it as a single result
-            result = [result]
-        
-        # Handle different result types
-        if result is None:
-            return jsonify({
-                'success': False,
-                'error': 'No data extracted',
-                'data': None
-            })
-        
-        # Convert result to list if it's a single item
-        if not isinstance(result, list):
-            if isinstance(result, dict):
-                # Single card or result item
-                result = [result]
-            else:
-                # Should already be handled above for strings, but handle other types
-                result = [result]
+        # Serve repeat requests from the cache unless ?nocache=1 is given
+        use_cache = request.args.get('nocache') != '1'
+        cache_key = hashlib.blake2b(
+            orjson.dumps((url, scrape_type, options), option=orjson.OPT_SORT_KEYS)
+        ).digest()
+        if use_cache:
+            with _scrape_cache_lock:
+                cached = _scrape_cache.get(cache_key)
+            if cached is not None:
+                return _json_response(cached)
         
-        # Ensure all items are JSON serializable
-        def make_serializable(obj):
-            if isinstance(obj, dict):
-                return {k: make_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [make_serializable(item) for item in obj]
-            elif hasattr(obj, '__dict__'):
-                return str(obj)
-            else:
-                return obj
+        body, status = run_scrape(url, scrape_type, options)
+        if status != 200 or not body.get('success'):
+            return _json_response(body, status)
         
-        result = make_serializable(result)
+        # Stream very large results item by item instead of building (and caching) one big buffer
+        if len(body['data']) > _STREAM_RESPONSE_THRESHOLD:
+            return app.response_class(_iter_scrape_body(body), content_type=_JSON_CONTENT_TYPE)
         
-        item_count = len(result) if isinstance(result, list) else 1
-        return jsonify({
-            'success': True,
-            'data': result,
-            'message': f'Successfully extracted {item_count} item(s)'
-        })
+        payload = orjson.dumps(body, default=_default)
+        with _scrape_cache_lock:
+            _scrape_cache[cache_key] = payload
+        return _json_response(payload)
     
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': str(e),
             'data': None
-        }), 500
+        }, 500)
+
+
+@app.route('/api/scrape/jobs', methods=['POST'])
+def create_scrape_job():
+    """Queue a scrape in the background and return its job id immediately."""
+    try:
+        url, scrape_type, options = _parse_scrape_request(request.get_json())
+        
+        if not url:
+            return _json_response({'error': 'URL is required'}, 400)
+        
+        _sweep_expired_jobs()
+        job_id = uuid.uuid4().hex
+        _save_job(job_id, 'queued')
+        _job_executor.submit(_run_scrape_job, job_id, url, scrape_type, options)
+        return _json_response({'job_id': job_id}, 202)
+    
+    except Exception as e:
+        return _json_response({'error': str(e)}, 500)
+
+
+@app.route('/api/scrape/jobs/<job_id>')
+def get_scrape_job(job_id):
+    """Report the status of a background scrape, including its result once finished."""
+    job = _load_job(job_id)
+    if job is None:
+        return _json_response({'error': 'Job not found'}, 404)
+    
+    # The state file already holds the encoded response body
+    return _json_response(job)
 
 
 @app.route('/api/export', methods=['POST'])
@@ -155,19 +401,17 @@ def export_data():
     try:
         data = request.get_json()
         export_data_list = data.get('data', [])
-        filename = data.get('filename', f'scraped_data_{datetime.now().strftime("%Y%m%d_%H%M%S")}')
+        filename = data.get('filename') or f'scraped_data_{time.strftime("%Y%m%d_%H%M%S")}'
         
         if not filename.endswith('.json'):
             filename += '.json'
         
         # Sanitize filename
-        filename = "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_', '.')).strip()
+        filename = _FILENAME_STRIP_RE.sub('', filename).strip()
         
-        downloads_dir = os.path.join(os.path.dirname(__file__), 'downloads')
         filepath = os.path.join(downloads_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data_list, f, indent=2, ensure_ascii=False)
+        _write_json_file(filepath, export_data_list)
         
         return jsonify({
             'success': True,
@@ -182,16 +426,35 @@ def export_data():
         }), 500
 
 
-@app.route('/api/download/<filename>')
+@app.route('/api/download/<filename>', methods=['GET', 'HEAD'])
 def download_file(filename):
     """Download exported file."""
     try:
-        downloads_dir = os.path.join(os.path.dirname(__file__), 'downloads')
-        filepath = os.path.join(downloads_dir, filename)
-        if os.path.exists(filepath):
-            return send_file(filepath, as_attachment=True)
-        else:
+        filepath = os.path.normpath(os.path.join(downloads_dir, filename))
+        # Refuse anything that resolves outside the downloads directory
+        if not filepath.startswith(downloads_dir + os.sep):
+            return jsonify({'error': 'Invalid filename'}), 403
+        try:
+            # Exports never change once written, so mtime + size make a stable ETag
+            st = os.stat(filepath)
+            if not stat.S_ISREG(st.st_mode):
+                # e.g. the jobs directory: only exported files are downloadable
+                return jsonify({'error': 'File not found'}), 404
+            etag = f'{st.st_mtime_ns:x}-{st.st_size:x}'
+            # HEAD goes through send_file too, so it gets the same conditional and range handling as GET
+            return send_file(
+                filepath,
+                as_attachment=True,
+                conditional=True,
+                etag=etag,
+                last_modified=st.st_mtime,
+                max_age=3600
+            )
+        except (FileNotFoundError, NotADirectoryError):
             return jsonify({'error': 'File not found'}), 404
+    except HTTPException:
+        # e.g. 416 for an unsatisfiable Range header
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -204,5 +467,5 @@ if __name__ == '__main__':
     print("Open your browser and go to: http://127.0.0.1:5000")
     print("\nPress Ctrl+C to stop the server")
     print("="*60 + "\n")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
 
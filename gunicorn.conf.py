@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for serving the web scraper with gevent workers.
+Scrape requests spend most of their time waiting on remote HTTP fetches,
+so cooperative gevent workers let one process serve many of them at once.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+# Patch the standard library before requests/urllib3 are imported by the app
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', '4'))
+worker_connections = 1000
+timeout = 120
+# Import the app (bs4, lxml, regex compilation, ...) once in the master and fork workers from it
+preload_app = True
@@ -7,12 +7,31 @@ Now includes AI-powered topic extraction using OpenAI's function calling.
 """
 
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from typing import Optional, Union, List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
+from bs4.dammit import EncodingDetector
+import soupsieve
+from cachetools import TTLCache
+from urllib.parse import urljoin, urlparse, urlsplit
+from typing import Any, Callable, Iterator, Literal, Optional, Protocol, Union, List, Dict, Tuple
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import islice, takewhile
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+import io
 import re
 import os
+import sys
 import json
+import threading
+import time
+import weakref
+import asyncio
+import hashlib
+import shelve
 
 # Try to import openai, if not available, the AI feature will be disabled
 try:
@@ -23,26 +42,165 @@ except ImportError:
     print("Warning: openai library not installed. AI features will be disabled.")
     print("Install it with: pip install openai")
 
+# Try to import selectolax; if not available, selector-based scraping uses BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Try to import lxml; if not available, link search walks a BeautifulSoup tree instead of streaming
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Try to import requests_cache; if not available, HTTP_CACHE is ignored and pages are only cached in memory
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Look for sentence-transformers without importing it (that pulls in torch); SemanticIndex imports it on
+# first use. If not available, the AI result cache only matches exact queries
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec('sentence_transformers') is not None
+if SENTENCE_TRANSFORMERS_AVAILABLE:
+    import numpy as np
+
+# Try to import httpx (installed with openai) to size the OpenAI client's connection pool
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Try to import tiktoken; if not available, request token counts are estimated from text length
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Try to import tenacity; if not available, rate-limited OpenAI calls are only retried by the SDK itself
+try:
+    from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+    TENACITY_AVAILABLE = True
+except ImportError:
+    TENACITY_AVAILABLE = False
+
+# Try to import aiohttp; if not available, scrape_many fetches pages one at a time
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
-def get_page_content(url: str) -> Optional[BeautifulSoup]:
+# Try to import orjson; if not available, saved results are written with the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Recently fetched pages: url -> (fetch time, response), least recently used first
+PAGE_CACHE_SIZE = 64
+PAGE_CACHE_TTL = 300  # seconds
+_PAGE_CACHE: "OrderedDict[str, Tuple[float, requests.Response]]" = OrderedDict()
+_PAGE_CACHE_LOCK = threading.Lock()
+
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+_FETCH_TIMEOUT = 10  # seconds
+
+# Name of an SQLite HTTP cache that persists responses across runs (see create_http_session); empty = off
+HTTP_CACHE = os.getenv('HTTP_CACHE', '')
+HTTP_CACHE_EXPIRE = 3600  # seconds
+
+
+
+def create_http_session(pool_connections: int = 16, pool_maxsize: int = 32) -> requests.Session:
     """
-    Fetch and parse webpage content.
+    Create a requests.Session with keep-alive connection pooling for page fetches.
+    
+    Connection errors are retried twice with a short backoff, and the default
+    request headers are set on the session once. If the HTTP_CACHE environment
+    variable names a cache and requests-cache is installed, responses are also
+    stored in that SQLite file and revalidated with ETag / Last-Modified, so
+    repeated runs get cheap 304s instead of full downloads.
+    
+    Args:
+        pool_connections (int): Number of per-host connection pools to keep
+        pool_maxsize (int): Maximum connections kept open per host
+        
+    Returns:
+        requests.Session: The configured session
+    """
+    if HTTP_CACHE and REQUESTS_CACHE_AVAILABLE:
+        session = requests_cache.CachedSession(HTTP_CACHE, backend='sqlite',
+                                               expire_after=HTTP_CACHE_EXPIRE, cache_control=True)
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(_REQUEST_HEADERS)
+    # Ask for every compression urllib3 can decode here (br/zstd when brotli/zstandard are installed)
+    session.headers['Accept-Encoding'] = requests.utils.DEFAULT_ACCEPT_ENCODING
+    return session
+
+
+# Shared requests.Session used for all page fetches (see set_http_session)
+_SESSION: requests.Session = create_http_session()
+
+
+def set_http_session(session: Optional[requests.Session]) -> None:
+    """
+    Use a different requests.Session for all page fetches, e.g. one with a larger pool.
+    
+    Build it with create_http_session so it carries the default request headers.
+    
+    Args:
+        session (Optional[requests.Session]): The session to use, or None to go back to the default pooled session
+    """
+    global _SESSION
+    _SESSION = session if session is not None else create_http_session()
+
+
+def _fetch_page(url: str) -> Optional[requests.Response]:
+    """
+    Fetch a webpage.
+    
+    Successful responses are kept in a small LRU cache for PAGE_CACHE_TTL seconds,
+    so running several scrapes against the same URL downloads it only once. Once
+    an entry has expired it is revalidated with If-None-Match / If-Modified-Since;
+    on 304 Not Modified the cached response (and its parsed tree, see
+    get_page_content) is reused without downloading the body again.
     
     Args:
         url (str): The URL to fetch
         
     Returns:
-        Optional[BeautifulSoup]: Parsed HTML content or None if error
+        Optional[requests.Response]: The successful response or None if error
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    cached = _cached_page(url)
+    if cached is not None:
+        return cached
     
     try:
         print(f"Fetching data from: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        return BeautifulSoup(response.content, 'html.parser')
+        stale = _cached_page(url, max_age=float('inf'))
+        response = _SESSION.get(url, timeout=_FETCH_TIMEOUT, headers=_revalidation_headers(stale))
+        if response.status_code == 304 and stale is not None:
+            response = stale
+        else:
+            response.raise_for_status()
+        _store_page(url, response)
+        return response
     except requests.exceptions.RequestException as e:
         print(f"Error fetching the URL: {e}")
         return None
@@ -51,7 +209,584 @@ def get_page_content(url: str) -> Optional[BeautifulSoup]:
         return None
 
 
-def search_text_by_keyword(url: str, keyword: str, case_sensitive: bool = False) -> Union[str, List[str], None]:
+def _cached_page(url: str, max_age: Optional[float] = None) -> Optional[requests.Response]:
+    """Return the cached response for url if it is younger than max_age (default PAGE_CACHE_TTL) seconds, else None."""
+    if max_age is None:
+        max_age = PAGE_CACHE_TTL
+    with _PAGE_CACHE_LOCK:
+        cached = _PAGE_CACHE.get(url)
+        if cached and time.monotonic() - cached[0] < max_age:
+            _PAGE_CACHE.move_to_end(url)
+            return cached[1]
+    return None
+
+
+def _revalidation_headers(response: Optional[requests.Response]) -> Dict[str, str]:
+    """Build conditional request headers from a cached response's ETag / Last-Modified."""
+    headers = {}
+    if response is not None:
+        if 'ETag' in response.headers:
+            headers['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+    return headers
+
+
+def _store_page(url: str, response: requests.Response) -> None:
+    """Put a successful response in the page cache, evicting the least recently used pages."""
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE[url] = (time.monotonic(), response)
+        _PAGE_CACHE.move_to_end(url)
+        while len(_PAGE_CACHE) > PAGE_CACHE_SIZE:
+            _PAGE_CACHE.popitem(last=False)
+
+
+async def _fetch(session: "aiohttp.ClientSession", url: str) -> Optional[requests.Response]:
+    """
+    Fetch a webpage with aiohttp and store it in the page cache.
+    
+    The body is wrapped in a requests.Response so the sync parsers and the
+    page cache handle it exactly like a page fetched by _fetch_page.
+    
+    Args:
+        session (aiohttp.ClientSession): The session to fetch with
+        url (str): The URL to fetch
+        
+    Returns:
+        Optional[requests.Response]: The successful response or None if error
+    """
+    cached = _cached_page(url)
+    if cached is not None:
+        return cached
+    
+    try:
+        print(f"Fetching data from: {url}")
+        async with session.get(url, headers=_REQUEST_HEADERS) as resp:
+            resp.raise_for_status()
+            response = requests.Response()
+            response.status_code = resp.status
+            response.url = str(resp.url)
+            response.headers = requests.structures.CaseInsensitiveDict(resp.headers)
+            response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+            response._content = await resp.read()
+        _store_page(url, response)
+        return response
+    except aiohttp.ClientError as e:
+        print(f"Error fetching the URL: {e}")
+        return None
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+
+
+def _client_session() -> "aiohttp.ClientSession":
+    """Create an aiohttp session with the same timeout as the sync fetch path."""
+    return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=_FETCH_TIMEOUT))
+
+
+async def prefetch_pages(urls: List[str]) -> None:
+    """
+    Download several pages concurrently into the page cache.
+    
+    All requests share one aiohttp.ClientSession and run as a single overlapped
+    wave, so the scrapers that follow read every page from the cache instead of
+    fetching them one after another. Does nothing if aiohttp is not installed.
+    
+    Args:
+        urls (List[str]): The URLs to fetch
+    """
+    if not AIOHTTP_AVAILABLE:
+        return
+    async with _client_session() as session:
+        tasks = [asyncio.ensure_future(_fetch(session, url)) for url in dict.fromkeys(urls)]
+        await asyncio.gather(*tasks)
+
+
+async def get_page_content_async(url: str) -> Optional[BeautifulSoup]:
+    """
+    Fetch and parse a webpage without blocking the event loop on the download.
+    
+    Args:
+        url (str): The URL to fetch
+        
+    Returns:
+        Optional[BeautifulSoup]: Parsed HTML content or None if error
+    """
+    if not AIOHTTP_AVAILABLE:
+        return await asyncio.to_thread(get_page_content, url)
+    async with _client_session() as session:
+        response = await _fetch(session, url)
+    return _parse_soup(response) if response is not None else None
+
+
+async def scrape_many_async(urls: List[str], fn: Callable, *args, **kwargs) -> List:
+    """
+    Run a scraper over several URLs, downloading all pages concurrently first.
+    
+    Args:
+        urls (List[str]): The URLs to scrape
+        fn (Callable): A scraper taking the URL as its first argument, e.g. search_text_by_keyword
+        *args, **kwargs: Extra arguments passed to fn for every URL
+        
+    Returns:
+        List: fn's result for each URL, in the same order as urls
+    """
+    await prefetch_pages(urls)
+    return [fn(url, *args, **kwargs) for url in urls]
+
+
+def scrape_many(urls: List[str], fn: Callable, *args, **kwargs) -> List:
+    """
+    Synchronous wrapper around scrape_many_async.
+    
+    Example:
+        scrape_many(["https://a.example", "https://b.example"], search_text_by_keyword, "about us")
+    """
+    return asyncio.run(scrape_many_async(urls, fn, *args, **kwargs))
+
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """Return the charset declared in the Content-Type header, or None so the parser can detect it."""
+    content_type = response.headers.get('Content-Type', '').lower()
+    return response.encoding if 'charset=' in content_type else None
+
+
+def _parse_soup(response: requests.Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse a fetched page with lxml, falling back to html.parser if lxml is unavailable."""
+    encoding = _declared_encoding(response)
+    try:
+        return BeautifulSoup(response.content, 'lxml', from_encoding=encoding, parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(response.content, 'html.parser', from_encoding=encoding, parse_only=parse_only)
+
+
+# Full parse trees per cached response, so scrapers run against the same page (e.g. both
+# tool calls of one AI query) share one parse. Entries go away with the response.
+_PARSED_PAGES: "weakref.WeakKeyDictionary[requests.Response, BeautifulSoup]" = weakref.WeakKeyDictionary()
+_PARSED_PAGES_LOCK = threading.Lock()
+
+
+def get_page_content(url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+    """
+    Fetch and parse webpage content.
+    
+    Full parses (no parse_only) are cached along with the page for as long as
+    it stays in the page cache; callers share the tree and must not modify it.
+    
+    Args:
+        url (str): The URL to fetch
+        parse_only (Optional[SoupStrainer]): Only build the matching tags (and their contents), e.g. SoupStrainer('img')
+        
+    Returns:
+        Optional[BeautifulSoup]: Parsed HTML content or None if error
+    """
+    response = _fetch_page(url)
+    if response is None:
+        return None
+    
+    try:
+        if parse_only is not None:
+            return _parse_soup(response, parse_only)
+        with _PARSED_PAGES_LOCK:
+            soup = _PARSED_PAGES.get(response)
+        if soup is None:
+            soup = _parse_soup(response)
+            with _PARSED_PAGES_LOCK:
+                soup = _PARSED_PAGES.setdefault(response, soup)
+        return soup
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(css_selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once for BeautifulSoup matching."""
+    return soupsieve.compile(css_selector)
+
+
+def _soup_selector(soup: BeautifulSoup) -> Callable[[str], list]:
+    """Return a select(css_selector) function over a parsed page using compiled selectors."""
+    return lambda css_selector: _compile_selector(css_selector).select(soup)
+
+
+# Fallback selectors tried in order when no selector is given
+_TEXT_SELECTORS = ('h1', 'h1.title', '.product-title', '.title', '[class*="title"]', 'h2')
+_IMAGE_SELECTORS = (
+    'img[class*="main"]',
+    'img[class*="product"]',
+    'img[class*="primary"]',
+    'img[class*="featured"]',
+    '.product-image img',
+    '.main-image img',
+    'img'
+)
+_LINK_SELECTORS = (
+    'a[href*="cart"]',
+    'a[href*="buy"]',
+    'a[href*="add"]',
+    'a[class*="button"]',
+    'a[class*="btn"]',
+    '.button a',
+    '.btn a',
+    'a[href]'
+)
+# Selectors scrape_card_results tries in order: card elements (when no selector is
+# given), then the title and the description inside each card
+_CARD_SELECTORS = (
+    '.card',
+    '.result-card',
+    '.item-card',
+    '.card-item',
+    '[class*="card"]',
+    '.result-item',
+    '.item',
+    '[class*="result"]',
+    '.product-card',
+    '.product-item',
+    '[data-testid*="card"]',
+    '[class*="grid-item"]',
+    '.search-result',
+    '[class*="search-result"]',
+    'article',
+    '[role="article"]'
+)
+# Every element the leading class-based card selectors can match (with its contents), so
+# auto-detection on the BeautifulSoup path can try those against a partial parse first
+_CARD_STRAINER = SoupStrainer(class_=re.compile(r'card|result|item'))
+_STRAINED_CARD_SELECTORS = tuple(takewhile(lambda selector: selector.startswith(('.', '[class*=')), _CARD_SELECTORS))
+# Card selectors a SoupStrainer can express exactly: tag, .class, #id, tag.class or tag#id
+_SIMPLE_SELECTOR_RE = re.compile(r'([a-zA-Z][a-zA-Z0-9]*)?(?:\.([\w-]+)|#([\w-]+))?')
+_CARD_TITLE_SELECTORS = ('h1', 'h2', 'h3', 'h4', '.title', '[class*="title"]', '[class*="name"]', '.card-title', '.result-title')
+_CARD_DESC_SELECTORS = ('.description', '.desc', '[class*="desc"]', 'p', '.text', '[class*="text"]', '.summary', '[class*="summary"]')
+for _selector in (_TEXT_SELECTORS + _IMAGE_SELECTORS + _LINK_SELECTORS + _CARD_SELECTORS):
+    _compile_selector(_selector)
+del _selector
+
+
+def _parse_lexbor(response: requests.Response) -> "LexborHTMLParser":
+    """Parse a fetched page with selectolax's Lexbor engine, letting it detect the encoding unless one is declared."""
+    encoding = _declared_encoding(response)
+    return LexborHTMLParser(response.text if encoding else response.content)
+
+
+# Lexbor trees per cached response, like _PARSED_PAGES
+_LEXBOR_PAGES: "weakref.WeakKeyDictionary[requests.Response, LexborHTMLParser]" = weakref.WeakKeyDictionary()
+_LEXBOR_PAGES_LOCK = threading.Lock()
+
+
+def _get_lexbor_tree(response: requests.Response) -> "LexborHTMLParser":
+    """
+    Return the shared Lexbor tree for a fetched page, parsing it on first use.
+    
+    The tree keeps script and style so selectors can target them; node_text and
+    _node_text_pieces skip their contents like BeautifulSoup's get_text does.
+    """
+    with _LEXBOR_PAGES_LOCK:
+        tree = _LEXBOR_PAGES.get(response)
+    if tree is None:
+        tree = _parse_lexbor(response)
+        with _LEXBOR_PAGES_LOCK:
+            tree = _LEXBOR_PAGES.setdefault(response, tree)
+    return tree
+
+
+def get_page_selector(url: str) -> Optional[Callable[[str], list]]:
+    """
+    Fetch a webpage and return a function that runs CSS selectors against it.
+    
+    Uses selectolax's Lexbor engine (C) when installed, which is much faster than
+    BeautifulSoup for selector matching; otherwise falls back to BeautifulSoup.
+    The Lexbor tree is the one _page_root shares.
+    Use node_text() and node_attrs() to read the returned nodes.
+    
+    Args:
+        url (str): The URL to fetch
+        
+    Returns:
+        Optional[Callable[[str], list]]: select(css_selector) -> matching nodes, or None if error
+    """
+    response = _fetch_page(url)
+    if response is None:
+        return None
+    
+    try:
+        if not SELECTOLAX_AVAILABLE:
+            return _soup_selector(_parse_soup(response))
+        
+        tree = _get_lexbor_tree(response)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+    
+    def select(css_selector: str) -> list:
+        try:
+            return tree.css(css_selector)
+        except SelectolaxError:
+            # Lexbor doesn't support every selector soupsieve does (e.g. :contains)
+            return _soup_selector(_parse_soup(response))(css_selector)
+    
+    return select
+
+
+# Elements whose text is code, not page content: BeautifulSoup's get_text skips it
+_LEXBOR_RAW_TEXT_TAGS = frozenset({'script', 'style'})
+
+
+def node_text(node) -> str:
+    """Return the stripped text of a BeautifulSoup Tag or selectolax node."""
+    if isinstance(node, Tag):
+        return node.get_text(strip=True)
+    if node.tag in _LEXBOR_RAW_TEXT_TAGS:
+        return node.text(strip=True)
+    return ''.join(_node_text_pieces(node))
+
+
+def node_attrs(node) -> Dict[str, Optional[str]]:
+    """Return the attribute dict of a BeautifulSoup Tag or selectolax node."""
+    if isinstance(node, Tag):
+        return node.attrs
+    return node.attributes
+
+
+def _node_text_pieces(node, exclude=None) -> List[str]:
+    """
+    Return the non-empty stripped text pieces of a BeautifulSoup Tag or selectolax node.
+    
+    ''.join(pieces) is node_text(node) and ' '.join(pieces) is get_text(separator=' ', strip=True).
+    Text inside exclude (a descendant element, e.g. the title) is left out.
+    """
+    if isinstance(node, Tag):
+        if exclude is None:
+            return list(node.stripped_strings)
+        excluded = {id(string) for string in exclude.strings}
+        texts = (string for string in node.strings if id(string) not in excluded)
+    else:
+        # Lexbor's text(separator=...) keeps whitespace-only pieces, so collect the text nodes by hand
+        text_nodes = (child for child in node.traverse(include_text=True) if child.tag == '-text')
+        if node.tag not in _LEXBOR_RAW_TEXT_TAGS:
+            # Like get_text, leave out script and style contents unless one of them is being read
+            text_nodes = (child for child in text_nodes if child.parent.tag not in _LEXBOR_RAW_TEXT_TAGS)
+        if exclude is not None:
+            excluded = {child.mem_id for child in exclude.traverse(include_text=True) if child.tag == '-text'}
+            text_nodes = (child for child in text_nodes if child.mem_id not in excluded)
+        texts = (child.text_content for child in text_nodes)
+    pieces = (text.strip() for text in texts)
+    return [piece for piece in pieces if piece]
+
+
+# Tags selectolax gives Lexbor's non-element nodes (comments are '-comment' in 0.3.x, '_comment' later)
+_LEXBOR_NON_ELEMENT_TAGS = frozenset({'-text', '-comment', '_comment', '-document', '!doctype'})
+
+
+def _iter_descendants(node) -> Iterator:
+    """Yield the descendant elements of a BeautifulSoup Tag or selectolax node in document order."""
+    if isinstance(node, Tag):
+        yield from (child for child in node.descendants if isinstance(child, Tag))
+        return
+    descendants = node.traverse()
+    next(descendants, None)  # traverse() starts with the node itself
+    yield from (child for child in descendants if child.tag not in _LEXBOR_NON_ELEMENT_TAGS)
+
+
+def _node_tag(node) -> str:
+    """Return the tag name of a BeautifulSoup Tag or selectolax node."""
+    if isinstance(node, Tag):
+        return node.name
+    return node.tag
+
+
+def _node_class(node) -> str:
+    """Return the class attribute of a BeautifulSoup Tag or selectolax node as one string."""
+    if isinstance(node, Tag):
+        return ' '.join(node.get('class', []))
+    return node.attributes.get('class') or ''
+
+
+def _node_find_all(node, tags: Tuple[str, ...]) -> list:
+    """Return the descendants of a BeautifulSoup Tag or selectolax node with one of the given tag names."""
+    if isinstance(node, Tag):
+        return node.find_all(list(tags))
+    return _node_select(node, ', '.join(tags))
+
+
+def _node_find(node, tags: Tuple[str, ...]):
+    """Return the first descendant of a BeautifulSoup Tag or selectolax node with one of the given tag names, or None."""
+    if isinstance(node, Tag):
+        return node.find(list(tags))
+    return _node_select_one(node, ', '.join(tags))
+
+
+def _node_find_link(node):
+    """Return the first descendant <a> with an href of a BeautifulSoup Tag or selectolax node, or None."""
+    if isinstance(node, Tag):
+        return node.find('a', href=True)
+    return _node_select_one(node, 'a[href]')
+
+
+def _node_select(node, css_selector: str) -> list:
+    """Return the descendants of a BeautifulSoup Tag or selectolax node matching a CSS selector."""
+    if isinstance(node, Tag):
+        return _compile_selector(css_selector).select(node)
+    # Lexbor also matches the node itself; BeautifulSoup only looks at descendants
+    return [match for match in node.css(css_selector) if match.mem_id != node.mem_id]
+
+
+def _node_select_one(node, css_selector: str):
+    """Return the first descendant of a BeautifulSoup Tag or selectolax node matching a CSS selector, or None."""
+    if isinstance(node, Tag):
+        return _compile_selector(css_selector).select_one(node)
+    match = node.css_first(css_selector)
+    if match is not None and match.mem_id == node.mem_id:
+        return next(iter(_node_select(node, css_selector)), None)
+    return match
+
+
+def _iter_node_children(node, tags: Tuple[str, ...]) -> Iterator:
+    """Yield the child elements of a BeautifulSoup Tag or selectolax node with one of the given tag names."""
+    if isinstance(node, Tag):
+        return (child for child in node.children if isinstance(child, Tag) and child.name in tags)
+    return (child for child in node.iter() if child.tag in tags)
+
+
+def _node_children(node, tags: Tuple[str, ...]) -> list:
+    """Return the child elements of a BeautifulSoup Tag or selectolax node with one of the given tag names."""
+    return list(_iter_node_children(node, tags))
+
+
+def _has_node_children(node, tags: Tuple[str, ...], count: int) -> bool:
+    """Return whether a node has at least count child elements with one of tags, stopping once it has seen them."""
+    return len(list(islice(_iter_node_children(node, tags), count))) == count
+
+
+def _node_key(node) -> int:
+    """Return an identity key for a BeautifulSoup Tag or selectolax node (selectolax wraps nodes in new objects)."""
+    if isinstance(node, Tag):
+        return id(node)
+    return node.mem_id
+
+
+class _DocumentOrder:
+    """
+    The elements of a parsed page in document order, for find_all_next / find_previous
+    style lookups that work on both BeautifulSoup and selectolax trees.
+    
+    The tree is walked once; after that each lookup is a binary search over the
+    positions of the wanted tags instead of a walk through the document.
+    """
+    
+    def __init__(self, root):
+        if isinstance(root, Tag):
+            self.nodes = [node for node in root.descendants if isinstance(node, Tag)]
+        else:
+            self.nodes = [node for node in root.traverse() if node.tag not in _LEXBOR_NON_ELEMENT_TAGS]
+        self.index = {_node_key(node): i for i, node in enumerate(self.nodes)}
+        self._positions: Dict[Tuple[str, ...], List[int]] = {}
+    
+    def _tag_positions(self, tags: Tuple[str, ...]) -> List[int]:
+        """Return the (sorted) positions of the elements with one of tags."""
+        positions = self._positions.get(tags)
+        if positions is None:
+            positions = self._positions[tags] = [
+                i for i, node in enumerate(self.nodes) if _node_tag(node) in tags
+            ]
+        return positions
+    
+    def following(self, node, tags: Tuple[str, ...], limit: int) -> list:
+        """Return up to limit elements with one of tags after node's start tag (descendants included)."""
+        positions = self._tag_positions(tags)
+        # The document itself isn't in nodes, so following(document) starts at the first element
+        start = bisect_right(positions, self.index.get(_node_key(node), -1))
+        return [self.nodes[i] for i in positions[start:start + limit]]
+    
+    def preceding(self, node, tags: Tuple[str, ...]):
+        """Return the closest element with one of tags before node's start tag (ancestors included), or None."""
+        positions = self._tag_positions(tags)
+        before = bisect_left(positions, self.index[_node_key(node)])
+        return self.nodes[positions[before - 1]] if before else None
+
+
+# Parts of a root-relative path that urljoin may rewrite: dot segments, doubled slashes,
+# tab/CR/LF, ;params and an empty query or fragment
+_URLJOIN_REWRITES_RE = re.compile(r'/\.|//|[\t\r\n;]|\?(?=#|$)|#$')
+
+
+@lru_cache(maxsize=256)
+def _url_origin(base_url: str) -> Optional[str]:
+    """Return the scheme://host[:port] of an http(s) base URL, or None for anything else."""
+    parts = urlsplit(base_url)
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _join_root_relative(path: str, base_url: str) -> str:
+    """
+    Resolve a '/'-rooted path against base_url.
+    
+    Most such links only need the base's origin in front, so they skip urljoin
+    (which re-parses base_url each time); paths it would rewrite still go through it.
+    """
+    origin = _url_origin(base_url)
+    if origin is None or _URLJOIN_REWRITES_RE.search(path):
+        return urljoin(base_url, path)
+    return origin + path
+
+
+# The first character tells the cases apart: '/' ('//host' or a root-relative path),
+# 'h' (possibly already absolute), '#' (a fragment of the page) or anything else (relative)
+@lru_cache(maxsize=4096)
+def _normalize_url(link_url: str, base_url: str) -> str:
+    """Convert relative link URLs to absolute URLs against base_url."""
+    if not link_url:
+        return ""
+    first = link_url[0]
+    if first == '/':
+        return 'https:' + link_url if link_url[1:2] == '/' else _join_root_relative(link_url, base_url)
+    if first == 'h' and link_url.startswith(('http://', 'https://')):
+        return link_url
+    if first == '#':
+        return base_url + link_url
+    return urljoin(base_url, link_url)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_image_url(img_url: str, base_url: str) -> str:
+    """Convert relative image URLs to absolute URLs against base_url."""
+    if not img_url:
+        return ""
+    first = img_url[0]
+    if first == '/':
+        return 'https:' + img_url if img_url[1:2] == '/' else _join_root_relative(img_url, base_url)
+    if first == 'h' and img_url.startswith(('http://', 'https://')):
+        return img_url
+    # Images never point at a fragment of the page, so '#' is resolved like any relative URL
+    return urljoin(base_url, img_url)
+
+
+# Attributes that may hold an image URL, in order of preference (lazy-loading libraries use the data-* ones)
+_IMG_SRC_ATTRS = ('src', 'data-src', 'data-lazy-src', 'data-original', 'data-url')
+
+
+def _first_src(attrs: Dict[str, Optional[str]]) -> Optional[str]:
+    """Return the first non-empty image URL attribute from an element's attributes, or None."""
+    for key in _IMG_SRC_ATTRS:
+        value = attrs.get(key)
+        if value:
+            return value
+    return None
+
+
+# Strainers for scrapers that only look at one kind of tag, so the rest of the page is never built
+_IMG_STRAINER = SoupStrainer('img')
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Elements whose text search_text_by_keyword matches against
+_TEXT_TAGS = frozenset({'p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'td', 'th', 'article', 'section'})
+
+
+def search_text_by_keyword(url: str, keyword: str, case_sensitive: bool = False,
+                           first_only: bool = False) -> Union[str, List[str], None]:
     """
     Search for text containing a specific keyword (e.g., "about us", "notice", "alert").
     
@@ -59,6 +794,7 @@ def search_text_by_keyword(url: str, keyword: str, case_sensitive: bool = False)
         url (str): The URL to scrape
         keyword (str): The keyword to search for
         case_sensitive (bool): Whether the search should be case-sensitive
+        first_only (bool): Stop at the first match and return only that text
         
     Returns:
         Union[str, List[str], None]: Found text(s) or None if error
@@ -67,36 +803,43 @@ def search_text_by_keyword(url: str, keyword: str, case_sensitive: bool = False)
     if not soup:
         return None
     
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
+    # No need to remove <script>/<style>: get_text() already skips their contents
     
     # Find all text elements containing the keyword
     found_texts = []
-    keyword_lower = keyword.lower() if not case_sensitive else keyword
+    seen_texts = set()
+    keyword_pattern = re.compile(re.escape(keyword), 0 if case_sensitive else re.IGNORECASE)
     
-    # Search in all text elements
-    all_text_elements = soup.find_all(['p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'td', 'th', 'article', 'section'])
+    found_alts = []
     
-    for element in all_text_elements:
-        text = element.get_text(strip=True)
-        if text:
-            text_to_search = text.lower() if not case_sensitive else text
-            if keyword_lower in text_to_search:
-                # Get the full text of the element and its parent context
-                full_text = element.get_text(separator=' ', strip=True)
-                if full_text and full_text not in found_texts:
-                    found_texts.append(full_text)
-    
-    # Also search in alt text and titles
-    for img in soup.find_all('img', alt=True):
-        alt_text = img.get('alt', '')
-        if alt_text:
-            alt_to_search = alt_text.lower() if not case_sensitive else alt_text
-            if keyword_lower in alt_to_search:
-                context = f"[Image Alt Text] {alt_text}"
-                if context not in found_texts:
-                    found_texts.append(context)
+    # Walk the tree once, checking text elements and image alt text in the same pass
+    for element in soup.descendants:
+        name = element.name
+        if name in _TEXT_TAGS:
+            text = element.get_text(strip=True)
+            if text:
+                if keyword_pattern.search(text):
+                    # Get the full text of the element and its parent context
+                    full_text = element.get_text(separator=' ', strip=True)
+                    if full_text and full_text not in seen_texts:
+                        seen_texts.add(full_text)
+                        found_texts.append(full_text)
+                        if first_only:
+                            break
+        elif name == 'img' and not (first_only and found_alts):
+            # Also search in alt text; these are reported after the text matches
+            alt_text = element.get('alt', '')
+            if alt_text:
+                if keyword_pattern.search(alt_text):
+                    found_alts.append(f"[Image Alt Text] {alt_text}")
+    
+    if first_only and found_texts:
+        found_alts = []
+    
+    for context in found_alts[:1] if first_only else found_alts:
+        if context not in seen_texts:
+            seen_texts.add(context)
+            found_texts.append(context)
     
     if found_texts:
         return found_texts[0] if len(found_texts) == 1 else found_texts
@@ -104,121 +847,98 @@ def search_text_by_keyword(url: str, keyword: str, case_sensitive: bool = False)
         return f"Not found - No text containing '{keyword}' was found"
 
 
-def list_all_images(url: str) -> List[str]:
+def iter_images(url: str) -> Iterator[str]:
     """
-    List all image URLs on the page.
+    Yield every distinct image URL on the page, in document order.
     
     Args:
         url (str): The URL to scrape
         
-    Returns:
-        List[str]: List of image URLs
+    Yields:
+        str: Absolute image URLs
     """
-    soup = get_page_content(url)
+    soup = get_page_content(url, parse_only=_IMG_STRAINER)
     if not soup:
-        return []
-    
-    def normalize_image_url(img_url: str) -> str:
-        """Convert relative URLs to absolute URLs."""
-        if not img_url:
-            return ""
-        if img_url.startswith('//'):
-            return 'https:' + img_url
-        elif img_url.startswith('http://') or img_url.startswith('https://'):
-            return img_url
-        elif img_url.startswith('/'):
-            return urljoin(url, img_url)
-        else:
-            return urljoin(url, img_url)
-    
-    images = []
-    img_tags = soup.find_all('img')
+        return
     
-    for idx, img in enumerate(img_tags, 1):
-        img_url = (img.get('src') or 
-                  img.get('data-src') or 
-                  img.get('data-lazy-src') or
-                  img.get('data-original') or
-                  img.get('data-url'))
+    seen_images = set()
+    for img in soup.find_all('img'):
+        img_url = _first_src(img.attrs)
         
         if img_url:
-            img_url = normalize_image_url(img_url)
-            if img_url and img_url not in images:
-                images.append(img_url)
+            img_url = _normalize_image_url(img_url, url)
+            if img_url and img_url not in seen_images:
+                seen_images.add(img_url)
+                yield img_url
+
+
+def list_all_images(url: str) -> List[str]:
+    """
+    List all image URLs on the page.
     
-    return images
+    Args:
+        url (str): The URL to scrape
+        
+    Returns:
+        List[str]: List of image URLs
+    """
+    return list(iter_images(url))
 
 
-def search_image_by_keyword(url: str, keyword: str) -> List[str]:
+def iter_images_matching(url: str, keyword: str) -> Iterator[str]:
     """
-    Search for images containing a specific keyword in alt text, title, or nearby text.
+    Yield distinct image URLs whose alt text, title, class or nearby text contains the keyword.
     
     Args:
         url (str): The URL to scrape
         keyword (str): The keyword to search for
         
-    Returns:
-        List[str]: List of image URLs (empty list if none found)
+    Yields:
+        str: Absolute image URLs, in document order
     """
     soup = get_page_content(url)
     if not soup:
-        return []
-    
-    def normalize_image_url(img_url: str) -> str:
-        """Convert relative URLs to absolute URLs."""
-        if not img_url:
-            return ""
-        if img_url.startswith('//'):
-            return 'https:' + img_url
-        elif img_url.startswith('http://') or img_url.startswith('https://'):
-            return img_url
-        elif img_url.startswith('/'):
-            return urljoin(url, img_url)
-        else:
-            return urljoin(url, img_url)
+        return
     
-    keyword_lower = keyword.lower()
-    found_images = []
+    keyword_pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+    seen_images = set()
     
     # Search in img tags
     for img in soup.find_all('img'):
-        alt_text = img.get('alt', '').lower()
-        title_text = img.get('title', '').lower()
-        class_text = ' '.join(img.get('class', [])).lower()
-        
-        # Check if keyword is in alt, title, or class
-        if (keyword_lower in alt_text or 
-            keyword_lower in title_text or 
-            keyword_lower in class_text):
-            
-            img_url = (img.get('src') or 
-                      img.get('data-src') or 
-                      img.get('data-lazy-src') or
-                      img.get('data-original') or
-                      img.get('data-url'))
-            
-            if img_url:
-                normalized_url = normalize_image_url(img_url)
-                if normalized_url and normalized_url not in found_images:
-                    found_images.append(normalized_url)
+        img_attrs = img.attrs
+        
+        # Check if keyword is in alt, title, or class (the class string is only built if needed)
+        matched = (keyword_pattern.search(img_attrs.get('alt', '')) or 
+                   keyword_pattern.search(img_attrs.get('title', '')) or 
+                   keyword_pattern.search(' '.join(img_attrs.get('class', []))))
         
         # Also check nearby text (parent elements)
-        parent = img.find_parent(['div', 'section', 'article', 'figure'])
-        if parent:
-            parent_text = parent.get_text(strip=True).lower()
-            if keyword_lower in parent_text:
-                img_url = (img.get('src') or 
-                          img.get('data-src') or 
-                          img.get('data-lazy-src') or
-                          img.get('data-original') or
-                          img.get('data-url'))
-                
-                if img_url:
-                    normalized_url = normalize_image_url(img_url)
-                    if normalized_url and normalized_url not in found_images:
-                        found_images.append(normalized_url)
+        if not matched:
+            parent = img.find_parent(['div', 'section', 'article', 'figure'])
+            matched = parent is not None and keyword_pattern.search(parent.get_text(strip=True))
+        
+        if matched:
+            img_url = _first_src(img_attrs)
+            
+            if img_url:
+                normalized_url = _normalize_image_url(img_url, url)
+                if normalized_url and normalized_url not in seen_images:
+                    seen_images.add(normalized_url)
+                    yield normalized_url
+
+
+def search_image_by_keyword(url: str, keyword: str) -> List[str]:
+    """
+    Search for images containing a specific keyword in alt text, title, or nearby text.
     
-    return found_images
+    Args:
+        url (str): The URL to scrape
+        keyword (str): The keyword to search for
+        
+    Returns:
+        List[str]: List of image URLs (empty list if none found)
+    """
+    return list(iter_images_matching(url, keyword))
 
 
 def scrape_text_with_selector(url: str, selector: Optional[str] = None) -> Union[str, List[str], None]:
@@ -232,24 +952,23 @@ def scrape_text_with_selector(url: str, selector: Optional[str] = None) -> Union
     Returns:
         Union[str, List[str], None]: Extracted text or list of texts, or None if error
     """
-    soup = get_page_content(url)
-    if not soup:
+    select = get_page_selector(url)
+    if not select:
         return None
     
     if selector:
-        elements = soup.select(selector)
+        elements = select(selector)
         if elements:
-            texts = [elem.get_text(strip=True) for elem in elements]
+            texts = [node_text(elem) for elem in elements]
             return texts[0] if len(texts) == 1 else texts
         else:
             return "Not found - No elements matched the selector"
     else:
         # Try common text selectors
-        selectors = ['h1', 'h1.title', '.product-title', '.title', '[class*="title"]', 'h2']
-        for sel in selectors:
-            elements = soup.select(sel)
+        for sel in _TEXT_SELECTORS:
+            elements = select(sel)
             if elements:
-                texts = [elem.get_text(strip=True) for elem in elements]
+                texts = [node_text(elem) for elem in elements]
                 return texts[0] if len(texts) == 1 else texts
         return "Not found - Could not find any text elements"
 
@@ -265,35 +984,19 @@ def scrape_image_with_selector(url: str, selector: Optional[str] = None) -> Unio
     Returns:
         Union[str, List[str], None]: Extracted image URL(s), or None if error
     """
-    soup = get_page_content(url)
-    if not soup:
+    select = get_page_selector(url)
+    if not select:
         return None
     
-    def normalize_image_url(img_url: str) -> str:
-        """Convert relative URLs to absolute URLs."""
-        if not img_url:
-            return ""
-        if img_url.startswith('//'):
-            return 'https:' + img_url
-        elif img_url.startswith('http://') or img_url.startswith('https://'):
-            return img_url
-        elif img_url.startswith('/'):
-            return urljoin(url, img_url)
-        else:
-            return urljoin(url, img_url)
-    
     if selector:
-        elements = soup.select(selector)
+        elements = select(selector)
         if elements:
             images = []
             for img in elements:
-                img_url = (img.get('src') or 
-                          img.get('data-src') or 
-                          img.get('data-lazy-src') or
-                          img.get('data-original') or
-                          img.get('data-url'))
+                img_attrs = node_attrs(img)
+                img_url = _first_src(img_attrs)
                 if img_url:
-                    images.append(normalize_image_url(img_url))
+                    images.append(_normalize_image_url(img_url, url))
             
             if images:
                 return images[0] if len(images) == 1 else images
@@ -303,28 +1006,15 @@ def scrape_image_with_selector(url: str, selector: Optional[str] = None) -> Unio
             return "Not found - No elements matched the selector"
     else:
         # Try common image selectors
-        selectors = [
-            'img[class*="main"]',
-            'img[class*="product"]',
-            'img[class*="primary"]',
-            'img[class*="featured"]',
-            '.product-image img',
-            '.main-image img',
-            'img'
-        ]
-        
-        for sel in selectors:
-            elements = soup.select(sel)
+        for sel in _IMAGE_SELECTORS:
+            elements = select(sel)
             if elements:
                 images = []
                 for img in elements:
-                    img_url = (img.get('src') or 
-                              img.get('data-src') or 
-                              img.get('data-lazy-src') or
-                              img.get('data-original') or
-                              img.get('data-url'))
+                    img_attrs = node_attrs(img)
+                    img_url = _first_src(img_attrs)
                     if img_url and not img_url.endswith('.svg'):
-                        images.append(normalize_image_url(img_url))
+                        images.append(_normalize_image_url(img_url, url))
                 
                 if images:
                     return images[0] if len(images) == 1 else images
@@ -332,6 +1022,92 @@ def scrape_image_with_selector(url: str, selector: Optional[str] = None) -> Unio
         return "Not found - Could not find any image elements"
 
 
+def _stream_encoding(response: requests.Response) -> str:
+    """Pick the encoding to decode a raw page with, in the same order BeautifulSoup tries them."""
+    encoding = (_declared_encoding(response) or
+                EncodingDetector.find_declared_encoding(response.content, is_html=True))
+    if encoding:
+        return encoding
+    try:
+        response.content.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'windows-1252'
+
+
+def _iter_links(response: requests.Response) -> Iterator[Tuple[Dict[str, str], str]]:
+    """
+    Yield (attributes, stripped text) for every <a href> on a fetched page, in document order.
+    
+    With lxml the page is stream-parsed and each anchor is discarded once it has
+    been yielded, so memory stays flat instead of growing with a full
+    BeautifulSoup tree. The class attribute is always returned as one string.
+    
+    Args:
+        response (requests.Response): The fetched page
+    """
+    if LXML_AVAILABLE:
+        try:
+            events = etree.iterparse(io.BytesIO(response.content), events=('end',), tag='a',
+                                     html=True, encoding=_stream_encoding(response))
+            for _, link in events:
+                if 'href' in link.attrib:
+                    attrs = dict(link.attrib)
+                    attrs['class'] = ' '.join(attrs.get('class', '').split())
+                    yield attrs, ''.join(text.strip() for text in link.itertext())
+                # Free the anchor and everything before it that has already been seen
+                link.clear()
+                while link.getprevious() is not None:
+                    del link.getparent()[0]
+            return
+        except (LookupError, etree.LxmlError):
+            # Unknown encoding or unparseable page: fall back to BeautifulSoup below
+            pass
+    
+    for link in _parse_soup(response, _LINK_STRAINER).find_all('a', href=True):
+        attrs = dict(link.attrs)
+        attrs['class'] = ' '.join(link.get('class', []))
+        yield attrs, link.get_text(strip=True)
+
+
+def _iter_links_matching(response: requests.Response, url: str, keyword: str) -> Iterator[str]:
+    """Yield distinct absolute link URLs on a fetched page whose text, href, title or class contains the keyword."""
+    keyword_pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+    seen_links = set()
+    
+    # Search in all anchor tags
+    for link_attrs, link_text in _iter_links(response):
+        href = link_attrs.get('href', '')
+        
+        # Check if keyword is in href, title, link text, or class (cheapest checks first)
+        if (keyword_pattern.search(href) or 
+            keyword_pattern.search(link_attrs.get('title', '')) or 
+            keyword_pattern.search(link_text) or 
+            keyword_pattern.search(link_attrs.get('class', ''))):
+            
+            if href and not href.startswith('javascript:'):
+                normalized_url = _normalize_url(href, url)
+                if normalized_url and normalized_url not in seen_links:
+                    seen_links.add(normalized_url)
+                    yield normalized_url
+
+
+def iter_links_matching(url: str, keyword: str) -> Iterator[str]:
+    """
+    Yield distinct link URLs containing a specific keyword in text or URL, in document order.
+    
+    Args:
+        url (str): The URL to scrape
+        keyword (str): The keyword to search for
+        
+    Yields:
+        str: Absolute link URLs (nothing if the page could not be fetched)
+    """
+    response = _fetch_page(url)
+    if response is not None:
+        yield from _iter_links_matching(response, url, keyword)
+
+
 def search_link_by_keyword(url: str, keyword: str) -> Union[str, List[str], None]:
     """
     Search for links containing a specific keyword in text or URL.
@@ -343,46 +1119,11 @@ def search_link_by_keyword(url: str, keyword: str) -> Union[str, List[str], None
     Returns:
         Union[str, List[str], None]: Link URL(s) or None if error
     """
-    soup = get_page_content(url)
-    if not soup:
+    response = _fetch_page(url)
+    if response is None:
         return None
     
-    def normalize_link_url(link_url: str) -> str:
-        """Convert relative URLs to absolute URLs."""
-        if not link_url:
-            return ""
-        if link_url.startswith('//'):
-            return 'https:' + link_url
-        elif link_url.startswith('http://') or link_url.startswith('https://'):
-            return link_url
-        elif link_url.startswith('/'):
-            return urljoin(url, link_url)
-        elif link_url.startswith('#'):
-            return url + link_url
-        else:
-            return urljoin(url, link_url)
-    
-    keyword_lower = keyword.lower()
-    found_links = []
-    
-    # Search in all anchor tags
-    for link in soup.find_all('a', href=True):
-        link_text = link.get_text(strip=True).lower()
-        href = link.get('href', '')
-        href_lower = href.lower()
-        title = link.get('title', '').lower()
-        class_text = ' '.join(link.get('class', [])).lower()
-        
-        # Check if keyword is in link text, href, title, or class
-        if (keyword_lower in link_text or 
-            keyword_lower in href_lower or 
-            keyword_lower in title or 
-            keyword_lower in class_text):
-            
-            if href and not href.startswith('javascript:'):
-                normalized_url = normalize_link_url(href)
-                if normalized_url and normalized_url not in found_links:
-                    found_links.append(normalized_url)
+    found_links = list(_iter_links_matching(response, url, keyword))
     
     if found_links:
         return found_links[0] if len(found_links) == 1 else found_links
@@ -390,6 +1131,12 @@ def search_link_by_keyword(url: str, keyword: str) -> Union[str, List[str], None
         return f"Not found - No links containing '{keyword}' were found"
 
 
+# Headings that delimit a section, and the elements collected as its content
+_SECTION_HEADINGS = frozenset({'h2', 'h3'})
+_SECTION_CONTENT_TAGS = frozenset({'p', 'ul', 'ol', 'div', 'article', 'section'})
+_SECTION_WALK_TAGS = ['h2', 'h3', 'p', 'ul', 'ol', 'div', 'article', 'section']
+
+
 def scrape_section_by_heading(url: str, heading_keyword: str) -> Union[str, None]:
     """
     Extract a section of content by finding a heading containing the keyword
@@ -406,100 +1153,36 @@ def scrape_section_by_heading(url: str, heading_keyword: str) -> Union[str, None
     if not soup:
         return None
     
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
+    # No need to remove <script>/<style>: get_text() already skips their contents
     
     heading_keyword_lower = heading_keyword.lower()
     
-    # Find all h2 and h3 headings
-    headings = soup.find_all(['h2', 'h3'])
-    
-    # Search for a heading containing the keyword
-    target_heading = None
-    target_index = -1
-    for idx, heading in enumerate(headings):
-        heading_text = heading.get_text(strip=True).lower()
-        if heading_keyword_lower in heading_text:
-            target_heading = heading
-            target_index = idx
-            break
+    # Find the first h2/h3 heading containing the keyword
+    target_heading = soup.find(
+        lambda tag: tag.name in _SECTION_HEADINGS and heading_keyword_lower in tag.get_text(strip=True).lower()
+    )
     
     if not target_heading:
         return f"Not found - No heading containing '{heading_keyword}' was found"
     
-    # Collect all content after the target heading until the next h2/h3
+    # Collect all content after the target heading until the next h2/h3, in one forward walk
     content_parts = []
-    
-    # Method 1: Get all elements in the document and find content between headings
-    all_elements = soup.find_all(['h2', 'h3', 'p', 'ul', 'ol', 'div', 'article', 'section'])
-    
-    # Find the position of target heading and next heading
-    start_collecting = False
-    for elem in all_elements:
-        # Start collecting when we find the target heading
-        if elem == target_heading:
-            start_collecting = True
-            continue
-        
-        # Stop if we hit another heading
-        if start_collecting and elem.name in ['h2', 'h3']:
+    for elem in target_heading.find_all_next(_SECTION_WALK_TAGS):
+        if elem.name in _SECTION_HEADINGS:
             break
-        
-        # Collect content
-        if start_collecting:
-            if elem.name in ['p', 'ul', 'ol', 'div', 'article', 'section']:
-                text = elem.get_text(separator=' ', strip=True)
-                if text and len(text.strip()) > 0:
-                    content_parts.append(text)
-    
-    # Method 2: If Method 1 didn't work, try traversing siblings
-    if not content_parts:
-        # Try to get next siblings of the heading's parent
-        parent = target_heading.parent
-        if parent:
-            # Get all next siblings of the parent until we hit a heading
-            for sibling in parent.next_siblings:
-                if hasattr(sibling, 'name'):
-                    if sibling.name in ['h2', 'h3']:
-                        break
-                    elif sibling.name in ['p', 'ul', 'ol', 'div', 'article', 'section']:
-                        text = sibling.get_text(separator=' ', strip=True)
-                        if text:
-                            content_parts.append(text)
-                elif hasattr(sibling, 'find_all'):
-                    # It's a Tag, find content elements
-                    for elem in sibling.find_all(['p', 'ul', 'ol', 'div']):
-                        if elem.find_parent(['h2', 'h3']) is None:  # Not nested in another heading
-                            text = elem.get_text(separator=' ', strip=True)
-                            if text:
-                                content_parts.append(text)
-                    # Check if this sibling contains a heading (stop condition)
-                    if sibling.find(['h2', 'h3']):
-                        break
+        text = elem.get_text(separator=' ', strip=True)
+        if text:
+            content_parts.append(text)
     
-    # Method 3: Get all text from the heading's next siblings directly
-    if not content_parts:
-        current = target_heading
-        # Try to find the container (article, main, or body)
-        container = current.find_parent(['article', 'main', 'section', 'body'])
-        if not container:
-            container = soup.body if soup.body else soup
-        
-        # Get all elements after the heading
-        found_heading = False
-        for elem in container.find_all(['h2', 'h3', 'p', 'ul', 'ol', 'div', 'article', 'section']):
-            if elem == target_heading:
-                found_heading = True
-                continue
-            
-            if found_heading:
-                if elem.name in ['h2', 'h3']:
-                    break
-                elif elem.name in ['p', 'ul', 'ol', 'div', 'article', 'section']:
-                    text = elem.get_text(separator=' ', strip=True)
-                    if text:
-                        content_parts.append(text)
+    # If another heading follows immediately, try the siblings of the heading's parent
+    if not content_parts and target_heading.parent:
+        for sibling in target_heading.parent.next_siblings:
+            if sibling.name in _SECTION_HEADINGS:
+                break
+            elif sibling.name in _SECTION_CONTENT_TAGS:
+                text = sibling.get_text(separator=' ', strip=True)
+                if text:
+                    content_parts.append(text)
     
     if content_parts:
         # Join and clean up the text, removing duplicates
@@ -530,33 +1213,18 @@ def scrape_link_with_selector(url: str, selector: Optional[str] = None) -> Union
     Returns:
         Union[str, List[str], None]: Extracted link URL(s), or None if error
     """
-    soup = get_page_content(url)
-    if not soup:
+    select = get_page_selector(url)
+    if not select:
         return None
     
-    def normalize_link_url(link_url: str) -> str:
-        """Convert relative URLs to absolute URLs."""
-        if not link_url:
-            return ""
-        if link_url.startswith('//'):
-            return 'https:' + link_url
-        elif link_url.startswith('http://') or link_url.startswith('https://'):
-            return link_url
-        elif link_url.startswith('/'):
-            return urljoin(url, link_url)
-        elif link_url.startswith('#'):
-            return url + link_url
-        else:
-            return urljoin(url, link_url)
-    
     if selector:
-        elements = soup.select(selector)
+        elements = select(selector)
         if elements:
             links = []
             for link in elements:
-                href = link.get('href')
+                href = node_attrs(link).get('href')
                 if href and not href.startswith('javascript:'):
-                    links.append(normalize_link_url(href))
+                    links.append(_normalize_url(href, url))
             
             if links:
                 return links[0] if len(links) == 1 else links
@@ -566,25 +1234,14 @@ def scrape_link_with_selector(url: str, selector: Optional[str] = None) -> Union
             return "Not found - No elements matched the selector"
     else:
         # Try common link selectors
-        selectors = [
-            'a[href*="cart"]',
-            'a[href*="buy"]',
-            'a[href*="add"]',
-            'a[class*="button"]',
-            'a[class*="btn"]',
-            '.button a',
-            '.btn a',
-            'a[href]'
-        ]
-        
-        for sel in selectors:
-            elements = soup.select(sel)
+        for sel in _LINK_SELECTORS:
+            elements = select(sel)
             if elements:
                 links = []
                 for link in elements:
-                    href = link.get('href')
+                    href = node_attrs(link).get('href')
                     if href and not href.startswith('javascript:'):
-                        links.append(normalize_link_url(href))
+                        links.append(_normalize_url(href, url))
                 
                 if links:
                     return links[0] if len(links) == 1 else links
@@ -592,6 +1249,491 @@ def scrape_link_with_selector(url: str, selector: Optional[str] = None) -> Union
         return "Not found - Could not find any link elements"
 
 
+# Matches OPENAI_API_KEY = "..." in config.py when it can't be imported
+_API_KEY_RE = re.compile(r'OPENAI_API_KEY\s*=\s*["\']([^"\']+)["\']')
+
+
+@lru_cache(maxsize=1)
+def _load_config_api_key() -> Optional[str]:
+    """
+    Load OPENAI_API_KEY from a config.py file next to this script.
+    
+    The file is only read on the first call; the result (including "no key")
+    is cached for the rest of the process.
+    
+    Returns:
+        Optional[str]: The API key, or None if config.py is missing or has no usable key
+    """
+    config_path = os.path.join(os.path.dirname(__file__), 'config.py')
+    try:
+        # Try to import config.py if it exists
+        if os.path.exists(config_path):
+            spec = importlib.util.spec_from_file_location("config", config_path)
+            config = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(config)
+            if hasattr(config, 'OPENAI_API_KEY'):
+                loaded_key = config.OPENAI_API_KEY
+                # Check if it's a valid key (not placeholder)
+                if loaded_key and loaded_key != "YOUR_OPENAI_API_KEY_HERE" and loaded_key.strip():
+                    api_key = loaded_key.strip()  # Remove any whitespace
+                    print(f"✓ API key loaded from config.py (length: {len(api_key)})")
+                    return api_key
+        else:
+            print(f"⚠ config.py not found at: {config_path}")
+    except Exception as e:
+        print(f"⚠ Error loading config.py: {e}")
+        # Try alternative method - direct file read
+        try:
+            if os.path.exists(config_path):
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                match = _API_KEY_RE.search(content)
+                if match:
+                    print(f"✓ API key loaded from config.py (alternative method)")
+                    return match.group(1).strip()
+        except Exception as e2:
+            print(f"⚠ Alternative config loading also failed: {e2}")
+    return None
+
+
+def _load_api_key() -> str:
+    """
+    Return the OpenAI API key from the OPENAI_API_KEY environment variable or config.py.
+    
+    The environment is checked on every call so a key exported at runtime is
+    picked up; config.py is only read once (see _load_config_api_key).
+    
+    Returns:
+        str: The API key, or an empty string if none is configured
+    """
+    return (os.getenv('OPENAI_API_KEY') or '').strip() or _load_config_api_key() or ''
+
+
+# OpenAI clients by API key, reused across calls so the SDK's HTTP connection pool is kept warm
+_OPENAI_CLIENTS: Dict[str, "openai.OpenAI"] = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
+
+def _openai_http_client() -> Optional["httpx.Client"]:
+    """
+    Build the HTTP client for an OpenAI client: a keep-alive pool large enough for
+    concurrent batches, and a short connect timeout. None leaves the SDK default.
+    """
+    if not HTTPX_AVAILABLE:
+        return None
+    return openai.DefaultHttpxClient(
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        timeout=httpx.Timeout(30.0, connect=5.0)
+    )
+
+
+def _get_openai_client(api_key: str) -> "openai.OpenAI":
+    """
+    Return the shared OpenAI client for an API key, creating it on first use.
+    
+    OpenRouter keys (sk-or-v1-) get a client pointed at OpenRouter's base URL.
+    Each client keeps its own pooled HTTP connections (see _openai_http_client).
+    """
+    with _OPENAI_CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(api_key)
+        if client is None:
+            if api_key.startswith('sk-or-v1-'):
+                # OpenRouter requires a different base URL
+                # Also add recommended headers (HTTP-Referer and X-Title)
+                client = openai.OpenAI(
+                    api_key=api_key,
+                    base_url="https://openrouter.ai/api/v1",
+                    default_headers={
+                        "HTTP-Referer": "https://github.com/yourusername/web-scraper",  # Optional: Your site URL
+                        "X-Title": "Web Scraper AI Tool"  # Optional: Your app name
+                    },
+                    http_client=_openai_http_client()
+                )
+            else:
+                client = openai.OpenAI(api_key=api_key, http_client=_openai_http_client())
+            _OPENAI_CLIENTS[api_key] = client
+        return client
+
+
+class RateLimiter:
+    """
+    Client-side token bucket for OpenAI requests per minute and tokens per minute.
+    
+    Both budgets refill continuously; acquire() blocks the calling thread until
+    a request of the given size fits, so concurrent batches stay under the
+    account limits instead of triggering a storm of 429 retries.
+    """
+    
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float):
+        self.max_requests = float(max_requests_per_minute)
+        self.max_tokens = float(max_tokens_per_minute)
+        self._available_requests = self.max_requests
+        self._available_tokens = self.max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._available_requests = min(self.max_requests, self._available_requests + elapsed * self.max_requests / 60)
+        self._available_tokens = min(self.max_tokens, self._available_tokens + elapsed * self.max_tokens / 60)
+    
+    def acquire(self, tokens: int) -> None:
+        """Wait until one request using `tokens` tokens fits in both budgets, then take it."""
+        tokens = min(tokens, self.max_tokens)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._available_requests >= 1 and self._available_tokens >= tokens:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+                wait = max((1 - self._available_requests) * 60 / self.max_requests,
+                           (tokens - self._available_tokens) * 60 / self.max_tokens)
+            time.sleep(wait)
+
+
+# Shared OpenAI rate limits; defaults match gpt-4o-mini on a tier-1 account
+_RATE_LIMITER = RateLimiter(int(os.getenv('OPENAI_RPM', '500')), int(os.getenv('OPENAI_TPM', '200000')))
+_COMPLETION_TOKENS_ESTIMATE = 100  # a tool call with one short argument
+
+
+@lru_cache(maxsize=8)
+def _token_encoding(model: str) -> "tiktoken.Encoding":
+    """Return the tiktoken encoding for a model name (OpenRouter 'openai/...' names included)."""
+    try:
+        return tiktoken.encoding_for_model(model.split('/')[-1])
+    except KeyError:
+        return tiktoken.get_encoding('o200k_base')
+
+
+def _estimate_tokens(model: str, messages: List[Dict[str, str]], tools: Optional[List[Dict]] = None) -> int:
+    """Estimate the tokens a chat completion request will consume, prompt plus reply."""
+    text = ''.join(message['content'] for message in messages)
+    if tools:
+        text += json.dumps(tools)
+    if TIKTOKEN_AVAILABLE:
+        prompt_tokens = len(_token_encoding(model).encode(text))
+    else:
+        prompt_tokens = len(text) // 4
+    return prompt_tokens + _COMPLETION_TOKENS_ESTIMATE
+
+
+def _create_chat_completion(client: "openai.OpenAI", **kwargs):
+    """Call client.chat.completions.create once the shared rate limiter has room for it."""
+    _RATE_LIMITER.acquire(_estimate_tokens(kwargs['model'], kwargs['messages'], kwargs.get('tools')))
+    return client.chat.completions.create(**kwargs)
+
+
+def _is_transient_rate_limit(error: BaseException) -> bool:
+    """True for 429s caused by request rate, not for an exhausted quota (retrying those can't help)."""
+    return isinstance(error, openai.RateLimitError) and 'insufficient_quota' not in str(error)
+
+
+if TENACITY_AVAILABLE and OPENAI_AVAILABLE:
+    # Retry the 429s that still get through with randomized exponential backoff
+    _create_chat_completion = retry(
+        retry=retry_if_exception(_is_transient_rate_limit),
+        wait=wait_random_exponential(min=1, max=60),
+        stop=stop_after_attempt(6),
+        reraise=True
+    )(_create_chat_completion)
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache: maps a key to (expiry time, value)."""
+    
+    def get(self, key: str) -> Optional[Tuple[float, Any]]: ...
+    
+    def set(self, key: str, entry: Tuple[float, Any]) -> None: ...
+
+
+class InMemoryLRU:
+    """CacheBackend kept in this process, evicting the least recently used entries."""
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: Tuple[float, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class DiskBackend:
+    """CacheBackend stored with shelve, so cached AI results survive restarts."""
+    
+    def __init__(self, path: str = os.path.join(os.path.expanduser('~'), '.cache', 'web_scraper', 'llm_cache')):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock, shelve.open(self.path) as db:
+            return db.get(key)
+    
+    def set(self, key: str, entry: Tuple[float, Any]) -> None:
+        with self._lock, shelve.open(self.path) as db:
+            db[key] = entry
+
+
+class LLMCache:
+    """
+    Exact-match cache for AI scrape results.
+    
+    Keys are hashes of everything that decides the model's answer (model, URL,
+    query and tool schema), so a repeated query skips both the OpenAI call and
+    the scrape that follows it.
+    """
+    
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+    
+    @staticmethod
+    def make_key(model: str, url: str, query: str, tools: List[Dict]) -> str:
+        """Hash the inputs of an AI scrape into a cache key."""
+        payload = json.dumps({"model": model, "url": url, "query": query, "tools": tools}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        entry = self.backend.get(key)
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1]
+    
+    def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+        """Cache value under key for ttl seconds."""
+        self.backend.set(key, (time.time() + ttl, value))
+
+
+class SemanticIndex:
+    """
+    Finds the cache key of an earlier AI query that means the same as a new one.
+    
+    Queries are embedded with a small local sentence-transformers model and
+    compared by cosine similarity, only against earlier queries with the same
+    scope (model, URL and tools), so "get all results" and "show me the results
+    list" for one page share a cached answer but different pages never do.
+    """
+    
+    def __init__(self, threshold: float = 0.92, model_name: str = 'all-MiniLM-L6-v2', max_entries: int = 1000,
+                 max_scopes: int = 256, ttl: int = 3600):
+        self.threshold = threshold
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self._model = None
+        self._model_lock = threading.Lock()
+        # Scopes not added to within ttl only hold expired results, so they are dropped with them
+        self._scopes: "TTLCache[str, Tuple[np.ndarray, List[str]]]" = TTLCache(maxsize=max_scopes, ttl=ttl)
+        # Queries still waiting on their AI call: cache key -> (scope, embedding), oldest first
+        self._staged: "OrderedDict[str, Tuple[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def embed(self, text: str) -> "np.ndarray":
+        """Embed text as a unit vector; callers embed a query once and pass it to lookup and add."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name, device='cpu')
+        return self._model.encode(text, normalize_embeddings=True)
+    
+    def lookup(self, scope: str, embedding: "np.ndarray") -> List[str]:
+        """Return the cache keys of earlier queries in scope that are similar enough, most similar first."""
+        with self._lock:
+            entry = self._scopes.get(scope)
+        if entry is None:
+            return []
+        matrix, keys = entry
+        similarities = matrix @ embedding
+        order = similarities.argsort()[::-1]
+        return [keys[i] for i in order if similarities[i] >= self.threshold]
+    
+    def add(self, scope: str, embedding: "np.ndarray", key: str) -> None:
+        """Remember that the query with this embedding in scope is cached under key."""
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is not None:
+                matrix, keys = entry
+                if key in keys:
+                    return
+                matrix, keys = np.vstack([matrix, embedding])[-self.max_entries:], (keys + [key])[-self.max_entries:]
+            else:
+                matrix, keys = embedding[np.newaxis, :], [key]
+            self._scopes[scope] = (matrix, keys)
+    
+    def discard(self, scope: str, key: str) -> None:
+        """Forget key in scope, e.g. once its cached result has expired."""
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is None:
+                return
+            matrix, keys = entry
+            if key not in keys:
+                return
+            i = keys.index(key)
+            if len(keys) == 1:
+                del self._scopes[scope]
+            else:
+                self._scopes[scope] = (np.delete(matrix, i, axis=0), keys[:i] + keys[i + 1:])
+    
+    def stage(self, key: str, scope: str, embedding: "np.ndarray") -> None:
+        """Hold a missed query until add_staged is called once its result is cached under key."""
+        with self._lock:
+            self._staged[key] = (scope, embedding)
+            self._staged.move_to_end(key)
+            while len(self._staged) > self.max_entries:
+                self._staged.popitem(last=False)
+    
+    def add_staged(self, key: str) -> None:
+        """Add the query staged under key, now that a result is cached for it."""
+        with self._lock:
+            staged = self._staged.pop(key, None)
+        if staged is not None:
+            self.add(staged[0], staged[1], key)
+
+
+# Cached AI results; set LLM_CACHE=disk to keep them under ~/.cache/web_scraper across runs
+LLM_CACHE_TTL = 3600  # seconds
+_LLM_CACHE = LLMCache(DiskBackend() if os.getenv('LLM_CACHE') == 'disk' else InMemoryLRU())
+_SEMANTIC_INDEX = SemanticIndex(ttl=LLM_CACHE_TTL) if SENTENCE_TRANSFORMERS_AVAILABLE else None
+
+
+def _cached_ai_result(model: str, url: str, query: str, tools: List[Dict]) -> Tuple[str, Any]:
+    """
+    Look up a cached AI scrape result, first by exact query and then by meaning.
+    
+    Returns:
+        Tuple[str, Any]: The cache key to store the result under, and the cached result or None
+    """
+    cache_key = LLMCache.make_key(model, url, query, tools)
+    cached = _LLM_CACHE.get(cache_key)
+    if cached is None and _SEMANTIC_INDEX is not None:
+        scope = LLMCache.make_key(model, url, '', tools)
+        embedding = _SEMANTIC_INDEX.embed(query)
+        for similar_key in _SEMANTIC_INDEX.lookup(scope, embedding):
+            cached = _LLM_CACHE.get(similar_key)
+            if cached is not None:
+                break
+            # Expired (or evicted) result: drop the key so it can't shadow a live one
+            _SEMANTIC_INDEX.discard(scope, similar_key)
+        if cached is None:
+            _SEMANTIC_INDEX.stage(cache_key, scope, embedding)
+    return cache_key, cached
+
+
+def _remember_ai_result(cache_key: str, result: Any) -> Any:
+    """Store an AI scrape result in the LLM cache unless it is an error, and return it."""
+    if not (isinstance(result, str) and result.startswith('Error:')):
+        _LLM_CACHE.set(cache_key, result, ttl=LLM_CACHE_TTL)
+        if _SEMANTIC_INDEX is not None:
+            _SEMANTIC_INDEX.add_staged(cache_key)
+    return result
+
+
+# Tool schema and system prompt for ai_scrape_topic (also sent by ai_scrape_topic_bulk)
+_TOPIC_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "scrape_section_by_heading",
+            "description": "Extract a section of content from a webpage by finding a heading that contains a keyword and returning all content under that heading until the next heading.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "heading_keyword": {
+                        "type": "string",
+                        "description": "A single keyword or short phrase that is likely to appear in an h2 or h3 heading on the webpage. This should be the most relevant term from the user's query that would identify the section they want. Examples: 'Gigafactories', 'Tesla', 'About Us', 'Pricing', 'Features'"
+                    },
+                    "url": {
+                        "type": "string",
+                        "description": "The URL of the webpage to scrape"
+                    }
+                },
+                "required": ["url", "heading_keyword"]
+            }
+        }
+    }
+]
+_TOPIC_SYSTEM_PROMPT = "You are a helpful assistant that analyzes user queries about web content and determines the best heading keyword to search for. You must always call the scrape_section_by_heading function with the most appropriate heading keyword."
+
+
+def _topic_messages(url: str, topic_query: str) -> List[Dict[str, str]]:
+    """Build the chat messages asking the model for the heading keyword of a topic query."""
+    user_message = f"User wants to extract information about: {topic_query}\n\n" \
+                  f"Analyze this query and determine the single most appropriate heading keyword " \
+                  f"that would be found in an h2 or h3 tag on the webpage at {url}. " \
+                  f"Then call the scrape_section_by_heading function with this keyword."
+    return [
+        {"role": "system", "content": _TOPIC_SYSTEM_PROMPT},
+        {"role": "user", "content": user_message}
+    ]
+
+
+def _run_topic_tool_call(function_name: str, arguments: str, url: str) -> str:
+    """Run the scrape_section_by_heading call chosen by the model and return its result."""
+    if function_name != "scrape_section_by_heading":
+        return f"Error: Unexpected function call: {function_name}"
+    
+    # Parse the function arguments
+    function_args = json.loads(arguments)
+    heading_keyword = function_args.get("heading_keyword")
+    function_url = function_args.get("url", url)
+    
+    print(f"AI determined heading keyword: '{heading_keyword}'")
+    print(f"Extracting section from: {function_url}")
+    
+    # Call the actual scraping function
+    return scrape_section_by_heading(function_url, heading_keyword)
+
+
+# Error messages returned by ai_scrape_topic, built once instead of on every failed call
+_QUOTA_ERROR_HEADER = (
+    f"\n{'='*60}\n"
+    "⚠ QUOTA/BILLING ISSUE - API Key is VALID but account has no credits!\n"
+    f"{'='*60}\n\n"
+)
+_QUOTA_ERROR_DETAILS = (
+    "Your API key is working correctly, but:\n"
+    "1. Your OpenAI account has exceeded its quota\n"
+    "2. OR your account has no billing setup\n"
+    "3. OR you've run out of credits\n\n"
+    "Solutions:\n"
+    "1. Check your billing: https://platform.openai.com/account/billing\n"
+    "2. Add payment method: https://platform.openai.com/account/billing/payment-methods\n"
+    "3. Check usage limits: https://platform.openai.com/account/limits\n"
+    "4. Add credits to your account\n\n"
+    "✅ Good News: Your API key is valid and loaded correctly!\n"
+    "   You just need to add credits/billing to use it."
+)
+_QUOTA_ERROR_MSG = _QUOTA_ERROR_HEADER + _QUOTA_ERROR_DETAILS
+_QUOTA_ERROR_429_MSG = _QUOTA_ERROR_HEADER + "Error Code: 429 (Insufficient Quota)\n\n" + _QUOTA_ERROR_DETAILS
+_AUTH_ERROR_TEMPLATE = (
+    "Error: Invalid API key. Please check your OpenAI API key.\n"
+    "Details: {details}\n"
+    "API Key (first 10 chars): {key_prefix}...\n"
+    "API Key length: {key_length} characters\n"
+    "\nTroubleshooting:\n"
+    "1. Verify your API key at: https://platform.openai.com/api-keys\n"
+    "2. Make sure there are no extra spaces or quotes in config.py\n"
+    "3. Check that the key starts with 'sk-'\n"
+    "4. Ensure your OpenAI account has credits/usage available"
+)
+
+
 def ai_scrape_topic(url: str, topic_query: str, api_key: Optional[str] = None) -> str:
     """
     Use AI (OpenAI) to intelligently determine the best heading keyword from a natural language query
@@ -608,58 +1750,10 @@ def ai_scrape_topic(url: str, topic_query: str, api_key: Optional[str] = None) -
     if not OPENAI_AVAILABLE:
         return "Error: OpenAI library is not installed. Please install it with: pip install openai"
     
-    # Get API key from parameter, config file, or environment variable
-    if api_key is None:
-        # First, try to get from environment variable
-        api_key = os.getenv('OPENAI_API_KEY')
-        if api_key:
-            api_key = api_key.strip()  # Remove whitespace
-        
-        # If not in environment, try to load from config.py file
-        if not api_key:
-            try:
-                # Try to import config.py if it exists
-                import sys
-                import importlib.util
-                config_path = os.path.join(os.path.dirname(__file__), 'config.py')
-                if os.path.exists(config_path):
-                    spec = importlib.util.spec_from_file_location("config", config_path)
-                    config = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(config)
-                    if hasattr(config, 'OPENAI_API_KEY'):
-                        loaded_key = config.OPENAI_API_KEY
-                        # Check if it's a valid key (not placeholder)
-                        if loaded_key and loaded_key != "YOUR_OPENAI_API_KEY_HERE" and loaded_key.strip():
-                            api_key = loaded_key.strip()  # Remove any whitespace
-                            print(f"✓ API key loaded from config.py (length: {len(api_key)})")
-                else:
-                    print(f"⚠ config.py not found at: {config_path}")
-            except Exception as e:
-                print(f"⚠ Error loading config.py: {e}")
-                # Try alternative method - direct file read
-                try:
-                    config_path = os.path.join(os.path.dirname(__file__), 'config.py')
-                    if os.path.exists(config_path):
-                        with open(config_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            # Simple regex to find API key
-                            import re
-                            match = re.search(r'OPENAI_API_KEY\s*=\s*["\']([^"\']+)["\']', content)
-                            if match:
-                                api_key = match.group(1).strip()
-                                print(f"✓ API key loaded from config.py (alternative method)")
-                except Exception as e2:
-                    print(f"⚠ Alternative config loading also failed: {e2}")
-        
-        # If still not found, use placeholder
-        if not api_key:
-            api_key = "YOUR_LLM_API_KEY"  # Placeholder
-    
-    # Clean up API key - remove any whitespace
-    if api_key:
-        api_key = api_key.strip()
-    
-    if api_key == "YOUR_LLM_API_KEY" or api_key == "YOUR_OPENAI_API_KEY_HERE" or not api_key:
+    # Get API key from parameter, environment variable, or config file
+    api_key = (api_key or "").strip() or _load_api_key()
+    
+    if api_key == "YOUR_OPENAI_API_KEY_HERE" or not api_key:
         return "Error: Please set your OpenAI API key. You can use one of these methods:\n" \
                "1. Set environment variable: export OPENAI_API_KEY='your-key-here' (Linux/Mac) or setx OPENAI_API_KEY 'your-key-here' (Windows)\n" \
                "2. Create config.py file in the same directory and set OPENAI_API_KEY = 'your-key-here'\n" \
@@ -681,52 +1775,14 @@ def ai_scrape_topic(url: str, topic_query: str, api_key: Optional[str] = None) -
             print("✓ Detected OpenRouter API key format")
             print("  Configuring client for OpenRouter...")
             
-            # OpenRouter requires a different base URL
-            # Also add recommended headers (HTTP-Referer and X-Title)
-            client = openai.OpenAI(
-                api_key=api_key,
-                base_url="https://openrouter.ai/api/v1",
-                default_headers={
-                    "HTTP-Referer": "https://github.com/yourusername/web-scraper",  # Optional: Your site URL
-                    "X-Title": "Web Scraper AI Tool"  # Optional: Your app name
-                }
-            )
+            client = _get_openai_client(api_key)
             print("  ✓ OpenRouter client configured successfully")
         else:
             # Standard OpenAI key
             print("✓ Using standard OpenAI API")
-            client = openai.OpenAI(api_key=api_key)
-        
-        # Define the tool schema for function calling
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "scrape_section_by_heading",
-                    "description": "Extract a section of content from a webpage by finding a heading that contains a keyword and returning all content under that heading until the next heading.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "heading_keyword": {
-                                "type": "string",
-                                "description": "A single keyword or short phrase that is likely to appear in an h2 or h3 heading on the webpage. This should be the most relevant term from the user's query that would identify the section they want. Examples: 'Gigafactories', 'Tesla', 'About Us', 'Pricing', 'Features'"
-                            },
-                            "url": {
-                                "type": "string",
-                                "description": "The URL of the webpage to scrape"
-                            }
-                        },
-                        "required": ["url", "heading_keyword"]
-                    }
-                }
-            }
-        ]
+            client = _get_openai_client(api_key)
         
-        # Create the user message
-        user_message = f"User wants to extract information about: {topic_query}\n\n" \
-                      f"Analyze this query and determine the single most appropriate heading keyword " \
-                      f"that would be found in an h2 or h3 tag on the webpage at {url}. " \
-                      f"Then call the scrape_section_by_heading function with this keyword."
+        tools = _TOPIC_TOOLS
         
         print(f"Analyzing topic query with AI: '{topic_query}'...")
         
@@ -742,19 +1798,17 @@ def ai_scrape_topic(url: str, topic_query: str, api_key: Optional[str] = None) -
             model = "gpt-4o-mini"
             print(f"  Using OpenAI model: {model}")
         
+        # Serve repeated queries from the cache without calling the API or re-scraping
+        cache_key, cached = _cached_ai_result(model, url, topic_query, tools)
+        if cached is not None:
+            print("✓ Using cached AI result")
+            return cached
+        
         # Call OpenAI/OpenRouter with function calling
-        response = client.chat.completions.create(
+        response = _create_chat_completion(
+            client,
             model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that analyzes user queries about web content and determines the best heading keyword to search for. You must always call the scrape_section_by_heading function with the most appropriate heading keyword."
-                },
-                {
-                    "role": "user",
-                    "content": user_message
-                }
-            ],
+            messages=_topic_messages(url, topic_query),
             tools=tools,
             tool_choice="required"  # Force the model to use the function
         )
@@ -764,100 +1818,404 @@ def ai_scrape_topic(url: str, topic_query: str, api_key: Optional[str] = None) -
         
         if message.tool_calls and len(message.tool_calls) > 0:
             tool_call = message.tool_calls[0]
-            function_name = tool_call.function.name
-            
-            if function_name == "scrape_section_by_heading":
-                # Parse the function arguments
-                function_args = json.loads(tool_call.function.arguments)
-                heading_keyword = function_args.get("heading_keyword")
-                function_url = function_args.get("url", url)
-                
-                print(f"AI determined heading keyword: '{heading_keyword}'")
-                print(f"Extracting section from: {function_url}")
-                
-                # Call the actual scraping function
-                result = scrape_section_by_heading(function_url, heading_keyword)
-                return result
-            else:
-                return f"Error: Unexpected function call: {function_name}"
+            result = _run_topic_tool_call(tool_call.function.name, tool_call.function.arguments, url)
+            return _remember_ai_result(cache_key, result)
         else:
             return "Error: AI did not generate a function call. Please rephrase your query or check the API response."
     
     except openai.RateLimitError as e:
-        error_msg = f"\n{'='*60}\n"
-        error_msg += f"⚠ QUOTA/BILLING ISSUE - API Key is VALID but account has no credits!\n"
-        error_msg += f"{'='*60}\n\n"
-        error_msg += f"Your API key is working correctly, but:\n"
-        error_msg += f"1. Your OpenAI account has exceeded its quota\n"
-        error_msg += f"2. OR your account has no billing setup\n"
-        error_msg += f"3. OR you've run out of credits\n\n"
-        error_msg += f"Solutions:\n"
-        error_msg += f"1. Check your billing: https://platform.openai.com/account/billing\n"
-        error_msg += f"2. Add payment method: https://platform.openai.com/account/billing/payment-methods\n"
-        error_msg += f"3. Check usage limits: https://platform.openai.com/account/limits\n"
-        error_msg += f"4. Add credits to your account\n\n"
-        error_msg += f"✅ Good News: Your API key is valid and loaded correctly!\n"
-        error_msg += f"   You just need to add credits/billing to use it."
-        return error_msg
+        return _QUOTA_ERROR_MSG
     except openai.APIError as e:
         error_code = getattr(e, 'status_code', None)
         error_body = getattr(e, 'body', {})
         
         # Check for quota/insufficient_quota errors
         if error_code == 429 or (isinstance(error_body, dict) and error_body.get('error', {}).get('code') == 'insufficient_quota'):
-            error_msg = f"\n{'='*60}\n"
-            error_msg += f"⚠ QUOTA/BILLING ISSUE - API Key is VALID but account has no credits!\n"
-            error_msg += f"{'='*60}\n\n"
-            error_msg += f"Error Code: 429 (Insufficient Quota)\n\n"
-            error_msg += f"Your API key is working correctly, but:\n"
-            error_msg += f"1. Your OpenAI account has exceeded its quota\n"
-            error_msg += f"2. OR your account has no billing setup\n"
-            error_msg += f"3. OR you've run out of credits\n\n"
-            error_msg += f"Solutions:\n"
-            error_msg += f"1. Check your billing: https://platform.openai.com/account/billing\n"
-            error_msg += f"2. Add payment method: https://platform.openai.com/account/billing/payment-methods\n"
-            error_msg += f"3. Check usage limits: https://platform.openai.com/account/limits\n"
-            error_msg += f"4. Add credits to your account\n\n"
-            error_msg += f"✅ Good News: Your API key is valid and loaded correctly!\n"
-            error_msg += f"   You just need to add credits/billing to use it."
-            return error_msg
+            return _QUOTA_ERROR_429_MSG
         else:
             return f"Error: OpenAI API error: {str(e)}\n\nIf this is an authentication error, please verify your API key is correct."
     except openai.AuthenticationError as e:
-        error_msg = f"Error: Invalid API key. Please check your OpenAI API key.\n"
-        error_msg += f"Details: {str(e)}\n"
-        error_msg += f"API Key (first 10 chars): {api_key[:10]}...\n"
-        error_msg += f"API Key length: {len(api_key)} characters\n"
-        error_msg += f"\nTroubleshooting:\n"
-        error_msg += f"1. Verify your API key at: https://platform.openai.com/api-keys\n"
-        error_msg += f"2. Make sure there are no extra spaces or quotes in config.py\n"
-        error_msg += f"3. Check that the key starts with 'sk-'\n"
-        error_msg += f"4. Ensure your OpenAI account has credits/usage available"
-        return error_msg
+        return _AUTH_ERROR_TEMPLATE.format_map({
+            'details': str(e),
+            'key_prefix': api_key[:10],
+            'key_length': len(api_key)
+        })
     except Exception as e:
         error_str = str(e)
         # Check if it's a quota error in the exception message
         if '429' in error_str or 'insufficient_quota' in error_str.lower() or 'quota' in error_str.lower():
-            error_msg = f"\n{'='*60}\n"
-            error_msg += f"⚠ QUOTA/BILLING ISSUE - API Key is VALID but account has no credits!\n"
-            error_msg += f"{'='*60}\n\n"
-            error_msg += f"Your API key is working correctly, but:\n"
-            error_msg += f"1. Your OpenAI account has exceeded its quota\n"
-            error_msg += f"2. OR your account has no billing setup\n"
-            error_msg += f"3. OR you've run out of credits\n\n"
-            error_msg += f"Solutions:\n"
-            error_msg += f"1. Check your billing: https://platform.openai.com/account/billing\n"
-            error_msg += f"2. Add payment method: https://platform.openai.com/account/billing/payment-methods\n"
-            error_msg += f"3. Check usage limits: https://platform.openai.com/account/limits\n"
-            error_msg += f"4. Add credits to your account\n\n"
-            error_msg += f"✅ Good News: Your API key is valid and loaded correctly!\n"
-            error_msg += f"   You just need to add credits/billing to use it."
-            return error_msg
+            return _QUOTA_ERROR_MSG
         else:
             return f"Error: An unexpected error occurred: {str(e)}\n\nAPI Key (first 10 chars): {api_key[:10]}..."
 
 
-def ai_scrape_result_list(url: str, topic_query: str, api_key: Optional[str] = None) -> Union[List[Dict[str, str]], str]:
+async def ai_scrape_topic_async(url: str, topic_query: str, api_key: Optional[str] = None) -> str:
+    """
+    Async version of ai_scrape_topic.
+    
+    The call runs in a worker thread, so it shares the cached OpenAI client
+    (and its connection pool) as well as the key handling and error messages
+    of the sync version, and the page fetch and parse don't block the event loop.
+    
+    Args:
+        url (str): The URL to scrape
+        topic_query (str): Natural language query
+        api_key (Optional[str]): OpenAI API key. If None, will try to get from environment variable OPENAI_API_KEY
+        
+    Returns:
+        str: The extracted section text or error message
+    """
+    return await asyncio.to_thread(ai_scrape_topic, url, topic_query, api_key)
+
+
+async def ai_scrape_topic_many_async(pairs: List[Tuple[str, str]], concurrency: int = 20,
+                                     api_key: Optional[str] = None) -> List[str]:
+    """
+    Run ai_scrape_topic for many (url, topic_query) pairs concurrently.
+    
+    All pages are downloaded first in one concurrent wave (see prefetch_pages),
+    then the OpenAI calls run with at most `concurrency` in flight, so a batch
+    takes about as long as its slowest queries instead of the sum of all of them.
+    The calls get their own thread pool of that size rather than asyncio's
+    default executor, which would cap a batch at min(32, CPUs + 4) threads.
+    
+    Args:
+        pairs (List[Tuple[str, str]]): (url, topic_query) pairs to extract
+        concurrency (int): Maximum number of OpenAI requests in flight at once
+        api_key (Optional[str]): OpenAI API key used for every pair
+        
+    Returns:
+        List[str]: The result for each pair, in the same order as pairs
+    """
+    await prefetch_pages([url for url, _ in pairs])
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='ai-scrape') as executor:
+        return await asyncio.gather(*[
+            loop.run_in_executor(executor, ai_scrape_topic, url, query, api_key) for url, query in pairs
+        ])
+
+
+def ai_scrape_topic_many(pairs: List[Tuple[str, str]], concurrency: int = 20,
+                         api_key: Optional[str] = None) -> List[str]:
+    """
+    Synchronous wrapper around ai_scrape_topic_many_async.
+    
+    Example:
+        ai_scrape_topic_many([("https://a.example", "pricing"), ("https://b.example", "about us")])
+    """
+    return asyncio.run(ai_scrape_topic_many_async(pairs, concurrency, api_key))
+
+
+async def ai_scrape_topics(pairs: List[Tuple[str, str]], api_key: Optional[str] = None) -> List[str]:
+    """
+    Run ai_scrape_topic for several (url, topic_query) pairs concurrently.
+    
+    Same as ai_scrape_topic_many_async with the default concurrency limit.
+    
+    Args:
+        pairs (List[Tuple[str, str]]): (url, topic_query) pairs to extract
+        api_key (Optional[str]): OpenAI API key used for every pair
+        
+    Returns:
+        List[str]: The result for each pair, in the same order as pairs
+    """
+    return await ai_scrape_topic_many_async(pairs, api_key=api_key)
+
+
+# ai_scrape_topic_packed's schema adds the item number each call answers; tool calls may come back in any order
+_PACKED_TOPIC_FUNCTION = _TOPIC_TOOLS[0]["function"]
+_PACKED_TOPIC_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            **_PACKED_TOPIC_FUNCTION,
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "item": {
+                        "type": "integer",
+                        "description": "The number of the item in the user message that this call answers"
+                    },
+                    **_PACKED_TOPIC_FUNCTION["parameters"]["properties"]
+                },
+                "required": ["item"] + _PACKED_TOPIC_FUNCTION["parameters"]["required"]
+            }
+        }
+    }
+]
+_PACKED_TOPIC_SYSTEM_PROMPT = _TOPIC_SYSTEM_PROMPT + " The user message lists several numbered items. Emit exactly one tool call per numbered item and pass that item's number as item."
+
+
+def ai_scrape_topic_packed(pairs: List[Tuple[str, str]], pack: int = 8,
+                           api_key: Optional[str] = None) -> List[str]:
+    """
+    Run ai_scrape_topic for many (url, topic_query) pairs, packing several queries into each API call.
+    
+    Up to `pack` numbered queries are sent in one chat completion and the model
+    answers with one tool call per item, tagged with the item's number, so a
+    group costs a single request against the requests-per-minute limit and the
+    system prompt is only paid for once. Use this when results are needed right away but the RPM limit is
+    the bottleneck; ai_scrape_topic_bulk is cheaper when results can wait.
+    
+    Args:
+        pairs (List[Tuple[str, str]]): (url, topic_query) pairs to extract
+        pack (int): Maximum number of queries per API call
+        api_key (Optional[str]): OpenAI API key. If None, uses OPENAI_API_KEY or config.py
+        
+    Returns:
+        List[str]: The result (or error message) for each pair, in the same order as pairs
+    """
+    if not OPENAI_AVAILABLE:
+        return ["Error: OpenAI library is not installed. Please install it with: pip install openai"] * len(pairs)
+    
+    api_key = (api_key or "").strip() or _load_api_key()
+    if not api_key.startswith('sk-') or api_key == "YOUR_OPENAI_API_KEY_HERE":
+        return ["Error: Please set a valid OpenAI API key (OPENAI_API_KEY or config.py)"] * len(pairs)
+    
+    model = "openai/gpt-4o-mini" if api_key.startswith('sk-or-v1-') else "gpt-4o-mini"
+    results: List[Optional[str]] = [None] * len(pairs)
+    cache_keys: Dict[int, str] = {}
+    for i, (url, topic_query) in enumerate(pairs):
+        cache_keys[i], results[i] = _cached_ai_result(model, url, topic_query, _TOPIC_TOOLS)
+    pending = [i for i, result in enumerate(results) if result is None]
+    
+    client = _get_openai_client(api_key)
+    for start in range(0, len(pending), max(1, pack)):
+        group = pending[start:start + max(1, pack)]
+        user_message = "\n".join(
+            f"{n}. url={pairs[i][0]} query={pairs[i][1]}" for n, i in enumerate(group, 1)
+        )
+        try:
+            response = _create_chat_completion(
+                client,
+                model=model,
+                messages=[
+                    {"role": "system", "content": _PACKED_TOPIC_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message}
+                ],
+                tools=_PACKED_TOPIC_TOOLS,
+                tool_choice="required",
+                parallel_tool_calls=True
+            )
+        except openai.APIError as e:
+            for i in group:
+                results[i] = f"Error: OpenAI API error: {str(e)}"
+            continue
+        
+        # Match tool calls to items by their item number, not their position
+        tool_calls = response.choices[0].message.tool_calls or []
+        calls_by_item: Dict[int, Any] = {}
+        invalid_arguments = None
+        lined_up = len(tool_calls) == len(group)
+        for call in tool_calls:
+            try:
+                n = int(json.loads(call.function.arguments)["item"])
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                # Malformed or truncated arguments only fail the item left without a call
+                invalid_arguments = e
+                continue
+            if not 1 <= n <= len(group) or n in calls_by_item:
+                lined_up = False
+            calls_by_item[n] = call
+        
+        for n, i in enumerate(group, 1):
+            if not lined_up:
+                # Skipped, repeated or unknown item numbers: no answer can be trusted, so none is cached
+                results[i] = f"Error: AI returned {len(tool_calls)} function calls that don't match the {len(group)} items. Please try again."
+                continue
+            if n not in calls_by_item:
+                results[i] = f"Error: AI returned invalid function arguments: {str(invalid_arguments)}"
+                continue
+            function = calls_by_item[n].function
+            try:
+                result = _run_topic_tool_call(function.name, function.arguments, pairs[i][0])
+            except (ValueError, KeyError, AttributeError) as e:
+                results[i] = f"Error: AI returned invalid function arguments: {str(e)}"
+                continue
+            results[i] = _remember_ai_result(cache_keys[i], result)
+    return results
+
+
+def ai_scrape_topic_bulk(pairs: List[Tuple[str, str]], api_key: Optional[str] = None,
+                         poll_interval: float = 10.0, max_workers: int = 8) -> List[str]:
+    """
+    Run ai_scrape_topic for a large number of (url, topic_query) pairs through OpenAI's Batch API.
+    
+    All model calls are submitted as one batch job (half the price of regular
+    calls, with separate and higher rate limits), the job is polled with
+    exponential backoff until it finishes, and the chosen sections are then
+    scraped locally in parallel. Pairs already in the AI result cache are not
+    resubmitted. Batch jobs can take up to 24 hours; use ai_scrape_topic_many
+    when results are needed right away. OpenRouter keys don't support the
+    Batch API and go through ai_scrape_topic_many instead.
+    
+    Args:
+        pairs (List[Tuple[str, str]]): (url, topic_query) pairs to extract
+        api_key (Optional[str]): OpenAI API key. If None, uses OPENAI_API_KEY or config.py
+        poll_interval (float): Seconds before the first status check; doubles up to 5 minutes
+        max_workers (int): Number of threads used to scrape the sections
+        
+    Returns:
+        List[str]: The result (or error message) for each pair, in the same order as pairs
+    """
+    if not OPENAI_AVAILABLE:
+        return ["Error: OpenAI library is not installed. Please install it with: pip install openai"] * len(pairs)
+    
+    api_key = (api_key or "").strip() or _load_api_key()
+    if not api_key.startswith('sk-') or api_key == "YOUR_OPENAI_API_KEY_HERE":
+        return ["Error: Please set a valid OpenAI API key (OPENAI_API_KEY or config.py)"] * len(pairs)
+    if api_key.startswith('sk-or-v1-'):
+        return ai_scrape_topic_many(pairs, api_key=api_key)
+    
+    model = "gpt-4o-mini"
+    results: List[Optional[str]] = [None] * len(pairs)
+    cache_keys: Dict[int, str] = {}
+    for i, (url, topic_query) in enumerate(pairs):
+        cache_keys[i], results[i] = _cached_ai_result(model, url, topic_query, _TOPIC_TOOLS)
+    pending = [i for i, result in enumerate(results) if result is None]
+    if not pending:
+        return results
+    
+    try:
+        client = _get_openai_client(api_key)
+        lines = [
+            json.dumps({
+                "custom_id": f"req-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": _topic_messages(*pairs[i]),
+                    "tools": _TOPIC_TOOLS,
+                    "tool_choice": "required"
+                }
+            })
+            for i in pending
+        ]
+        batch_file = client.files.create(file=("topics.jsonl", "\n".join(lines).encode('utf-8')), purpose="batch")
+        batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions",
+                                      completion_window="24h")
+        print(f"Submitted batch {batch.id} with {len(pending)} queries")
+        
+        delay = poll_interval
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(delay)
+            delay = min(delay * 2, 300)
+            batch = client.batches.retrieve(batch.id)
+            print(f"  Batch {batch.id}: {batch.status}")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            error = f"Error: Batch {batch.id} ended with status '{batch.status}'"
+            return [error if result is None else result for result in results]
+        
+        # Collect the tool call chosen for each request; a malformed line only loses its own item
+        tool_calls: Dict[int, Tuple[str, str]] = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            try:
+                row = json.loads(line)
+                response = row.get("response") or {}
+                choices = (response.get("body") or {}).get("choices") or []
+                calls = choices[0]["message"].get("tool_calls") if choices else None
+                if calls:
+                    function = calls[0]["function"]
+                    tool_calls[int(row["custom_id"].split("-", 1)[1])] = (function["name"], function["arguments"])
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                continue
+    except openai.APIError as e:
+        error = f"Error: OpenAI API error: {str(e)}"
+        return [error if result is None else result for result in results]
+    
+    def run(i: int) -> str:
+        if i not in tool_calls:
+            return "Error: AI did not generate a function call. Please rephrase your query or check the API response."
+        try:
+            result = _run_topic_tool_call(*tool_calls[i], pairs[i][0])
+        except (ValueError, KeyError, AttributeError) as e:
+            return f"Error: AI returned invalid function arguments: {str(e)}"
+        return _remember_ai_result(cache_keys[i], result)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i, result in zip(pending, executor.map(run, pending)):
+            results[i] = result
+    return results
+
+
+# Tool schemas and system prompt for ai_scrape_result_list. Both are sent verbatim on
+# every call, with the URL and query in a short user message after them, so the
+# request prefix stays identical and OpenAI's prompt caching can reuse it.
+_RESULT_LIST_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "scrape_result_list",
+            "description": "Extract a list of results from a webpage by finding a section (like 'Results', 'Admit Cards', 'Latest Jobs') and returning all list items from that section. Each result should have a title, link, and optionally a status.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "section_name": {
+                        "type": "string",
+                        "description": "The name of the section to extract results from. Examples: 'Results', 'Admit Cards', 'Latest Jobs', 'Notifications'. This should match the heading or title of the section on the webpage."
+                    },
+                    "url": {
+                        "type": "string",
+                        "description": "The URL of the webpage to scrape"
+                    }
+                },
+                "required": ["url", "section_name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "scrape_section_by_heading",
+            "description": "Extract a section of content from a webpage by finding a heading that contains a keyword and returning all content under that heading until the next heading.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "heading_keyword": {
+                        "type": "string",
+                        "description": "A single keyword or short phrase that is likely to appear in an h2 or h3 heading on the webpage."
+                    },
+                    "url": {
+                        "type": "string",
+                        "description": "The URL of the webpage to scrape"
+                    }
+                },
+                "required": ["url", "heading_keyword"]
+            }
+        }
+    }
+]
+_RESULT_LIST_SYSTEM_PROMPT = (
+    "You are a helpful assistant that analyzes user queries about web content and determines the best method to extract data. "
+    "The user message gives the URL of the webpage and the query. "
+    "For queries about result lists, jobs, admit cards, or similar structured list data, use scrape_result_list "
+    "with the best section name (like 'Results', 'Admit Cards', 'Latest Jobs') that would be found on the webpage. "
+    "For other content extraction, use scrape_section_by_heading."
+)
+
+
+# Section names a result-list query can be routed to without asking the model.
+# The names are matched as substrings of the lower-cased heading text by
+# scrape_result_list, so the singular form also finds "Results", "Latest Jobs", etc.
+_SECTION_QUERY_RE = re.compile(r'\b(result|admit|job|notification)(?:s|\s*cards?)?\b', re.IGNORECASE)
+_SECTION_QUERY_NAMES = {'result': 'Result', 'admit': 'Admit Card', 'job': 'Job', 'notification': 'Notification'}
+
+
+def _extract_section_from_query(topic_query: str) -> Optional[str]:
+    """
+    Pick the result-list section named in a query (e.g. "latest admit cards" -> "Admit Card").
+    
+    Returns:
+        Optional[str]: The section name, or None if the query names no known section
+    """
+    match = _SECTION_QUERY_RE.search(topic_query)
+    return _SECTION_QUERY_NAMES[match.group(1).lower()] if match else None
+
+
+def ai_scrape_result_list(url: str, topic_query: str, api_key: Optional[str] = None,
+                          intent: Literal["list", "section", "auto"] = "auto") -> Union[List[Dict[str, str]], str]:
     """
     Use AI (OpenAI) to intelligently extract result lists from a webpage based on a natural language query.
     This is perfect for extracting results from sections like "Results", "Admit Cards", "Latest Jobs" etc.
@@ -866,55 +2224,27 @@ def ai_scrape_result_list(url: str, topic_query: str, api_key: Optional[str] = N
         url (str): The URL to scrape
         topic_query (str): Natural language query (e.g., "Extract all results from the Results section", "Get all job listings")
         api_key (Optional[str]): OpenAI API key. If None, will try to get from config.py or environment variable
+        intent (str): "auto" lets the AI choose between a result list and a text section.
+                      "list" skips the AI call when the query names a known section (results, admit cards,
+                      jobs, notifications) and otherwise only offers the AI the result-list function.
+                      "section" only offers the AI the text-section function.
         
     Returns:
         Union[List[Dict[str, str]], str]: List of result dictionaries or error message
     """
+    # The caller already wants a result list; if the query names the section, no AI routing is needed
+    if intent == "list":
+        section_name = _extract_section_from_query(topic_query)
+        if section_name:
+            print(f"Extracting result list '{section_name}' from: {url}")
+            return scrape_result_list(url, section_name, None)
+    
     if not OPENAI_AVAILABLE:
         return "Error: OpenAI library is not installed. Please install it with: pip install openai"
     
-    # Get API key from config.py (same logic as ai_scrape_topic)
-    if api_key is None:
-        api_key = os.getenv('OPENAI_API_KEY')
-        if api_key:
-            api_key = api_key.strip()
-        
-        if not api_key:
-            try:
-                import sys
-                import importlib.util
-                config_path = os.path.join(os.path.dirname(__file__), 'config.py')
-                if os.path.exists(config_path):
-                    spec = importlib.util.spec_from_file_location("config", config_path)
-                    config = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(config)
-                    if hasattr(config, 'OPENAI_API_KEY'):
-                        loaded_key = config.OPENAI_API_KEY
-                        if loaded_key and loaded_key != "YOUR_OPENAI_API_KEY_HERE" and loaded_key.strip():
-                            api_key = loaded_key.strip()
-                            print(f"✓ API key loaded from config.py (length: {len(api_key)})")
-            except Exception as e:
-                print(f"⚠ Error loading config.py: {e}")
-                try:
-                    config_path = os.path.join(os.path.dirname(__file__), 'config.py')
-                    if os.path.exists(config_path):
-                        with open(config_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            import re
-                            match = re.search(r'OPENAI_API_KEY\s*=\s*["\']([^"\']+)["\']', content)
-                            if match:
-                                api_key = match.group(1).strip()
-                                print(f"✓ API key loaded from config.py (alternative method)")
-                except Exception as e2:
-                    print(f"⚠ Alternative config loading also failed: {e2}")
-        
-        if not api_key:
-            api_key = "YOUR_LLM_API_KEY"
-    
-    if api_key:
-        api_key = api_key.strip()
-    
-    if api_key == "YOUR_LLM_API_KEY" or api_key == "YOUR_OPENAI_API_KEY_HERE" or not api_key:
+    api_key = (api_key or "").strip() or _load_api_key()
+    
+    if api_key == "YOUR_OPENAI_API_KEY_HERE" or not api_key:
         return "Error: Please set your OpenAI API key in config.py file. Get your API key from:\n" \
                "  - OpenAI: https://platform.openai.com/api-keys\n" \
                "  - OpenRouter: https://openrouter.ai/keys (supports multiple AI models)"
@@ -925,85 +2255,34 @@ def ai_scrape_result_list(url: str, topic_query: str, api_key: Optional[str] = N
     try:
         print(f"Initializing OpenAI client for result list extraction...")
         
+        client = _get_openai_client(api_key)
         if api_key.startswith('sk-or-v1-'):
-            client = openai.OpenAI(
-                api_key=api_key,
-                base_url="https://openrouter.ai/api/v1",
-                default_headers={
-                    "HTTP-Referer": "https://github.com/yourusername/web-scraper",
-                    "X-Title": "Web Scraper AI Tool"
-                }
-            )
             model = "openai/gpt-4o-mini"
         else:
-            client = openai.OpenAI(api_key=api_key)
             model = "gpt-4o-mini"
         
-        # Define the tool schema for function calling - support both section extraction and result list extraction
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "scrape_result_list",
-                    "description": "Extract a list of results from a webpage by finding a section (like 'Results', 'Admit Cards', 'Latest Jobs') and returning all list items from that section. Each result should have a title, link, and optionally a status.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "section_name": {
-                                "type": "string",
-                                "description": "The name of the section to extract results from. Examples: 'Results', 'Admit Cards', 'Latest Jobs', 'Notifications'. This should match the heading or title of the section on the webpage."
-                            },
-                            "url": {
-                                "type": "string",
-                                "description": "The URL of the webpage to scrape"
-                            }
-                        },
-                        "required": ["url", "section_name"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "scrape_section_by_heading",
-                    "description": "Extract a section of content from a webpage by finding a heading that contains a keyword and returning all content under that heading until the next heading.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "heading_keyword": {
-                                "type": "string",
-                                "description": "A single keyword or short phrase that is likely to appear in an h2 or h3 heading on the webpage."
-                            },
-                            "url": {
-                                "type": "string",
-                                "description": "The URL of the webpage to scrape"
-                            }
-                        },
-                        "required": ["url", "heading_keyword"]
-                    }
-                }
-            }
-        ]
-        
-        user_message = f"User wants to extract result list from: {topic_query}\n\n" \
-                      f"Analyze this query and determine the best section name (like 'Results', 'Admit Cards', 'Latest Jobs') " \
-                      f"that would be found on the webpage at {url}. " \
-                      f"If the query is about extracting a list of results, jobs, admit cards, or similar structured data, " \
-                      f"use the scrape_result_list function. Otherwise, use scrape_section_by_heading function."
+        # With a fixed intent only the matching tool is offered, so the model can't pick the other one
+        if intent == "list":
+            tools = _RESULT_LIST_TOOLS[:1]
+        elif intent == "section":
+            tools = _RESULT_LIST_TOOLS[1:]
+        else:
+            tools = _RESULT_LIST_TOOLS
         
         print(f"Analyzing topic query with AI: '{topic_query}'...")
         
-        response = client.chat.completions.create(
+        # Serve repeated queries from the cache without calling the API or re-scraping
+        cache_key, cached = _cached_ai_result(model, url, topic_query, tools)
+        if cached is not None:
+            print("✓ Using cached AI result")
+            return cached
+        
+        response = _create_chat_completion(
+            client,
             model=model,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that analyzes user queries about web content and determines the best method to extract data. For queries about result lists, jobs, admit cards, or similar structured list data, use scrape_result_list. For other content extraction, use scrape_section_by_heading."
-                },
-                {
-                    "role": "user",
-                    "content": user_message
-                }
+                {"role": "system", "content": _RESULT_LIST_SYSTEM_PROMPT},
+                {"role": "user", "content": f"URL: {url}\nQuery: {topic_query}"}
             ],
             tools=tools,
             tool_choice="required"
@@ -1024,7 +2303,7 @@ def ai_scrape_result_list(url: str, topic_query: str, api_key: Optional[str] = N
                 print(f"Extracting result list from: {function_url}")
                 
                 result = scrape_result_list(function_url, section_name, None)
-                return result
+                return _remember_ai_result(cache_key, result)
             elif function_name == "scrape_section_by_heading":
                 function_args = json.loads(tool_call.function.arguments)
                 heading_keyword = function_args.get("heading_keyword")
@@ -1036,8 +2315,8 @@ def ai_scrape_result_list(url: str, topic_query: str, api_key: Optional[str] = N
                 result = scrape_section_by_heading(function_url, heading_keyword)
                 # Convert text result to list format for consistency
                 if isinstance(result, str) and not result.startswith('Error:') and not result.startswith('Not found'):
-                    return [{'title': heading_keyword, 'text': result, 'link': '', 'status': ''}]
-                return result
+                    result = [{'title': heading_keyword, 'text': result, 'link': '', 'status': ''}]
+                return _remember_ai_result(cache_key, result)
             else:
                 return f"Error: Unexpected function call: {function_name}"
         else:
@@ -1051,6 +2330,244 @@ def ai_scrape_result_list(url: str, topic_query: str, api_key: Optional[str] = N
             return f"Error: An unexpected error occurred: {str(e)}"
 
 
+# Words that suggest a list holds results, matched in one scan of an item's lower-cased text
+_RESULT_KEYWORD_RE = re.compile(r'result|admit|card|exam|job|notification|form|out|start')
+# Status of a result item: a "- Out"-style suffix anywhere in the text (group 1), else
+# text in parentheses at the end (group 2). Used with match(); each alternative starts
+# with a lazy skip so the suffix wins over the parentheses, as when they were searched
+# one after the other.
+_STATUS_RE = re.compile(
+    r'(?:[\s\S]*?\s*-\s*(Out|Final Result|Start|Last Date|Date Extend|Reminder|Booking)|[\s\S]*?\((.*?)\)$)',
+    re.IGNORECASE
+)
+# Class names of headings that introduce a result section
+_CLASS_HEAD_RE = re.compile(r'title|heading|header', re.I)
+
+
+def _extract_result_item(item_element, base_url: str) -> Dict[str, str]:
+    """Extract the title, link, text and status of a single result list item (a BeautifulSoup Tag or selectolax node)."""
+    result_data = {
+        'title': '',
+        'link': '',
+        'text': '',
+        'status': ''
+    }
+    
+    # Try to find a link in the item
+    link_elem = _node_find_link(item_element)
+    
+    if link_elem is not None:
+        # Extract link
+        result_data['link'] = _normalize_url(node_attrs(link_elem).get('href'), base_url)
+        # Extract title/text from link
+        link_text = node_text(link_elem)
+        if link_text:
+            result_data['title'] = link_text
+            result_data['text'] = link_text
+    elif _node_tag(item_element) == 'a' and node_attrs(item_element).get('href'):
+        # The item itself is a link
+        result_data['link'] = _normalize_url(node_attrs(item_element).get('href'), base_url)
+        link_text = node_text(item_element)
+        if link_text:
+            result_data['title'] = link_text
+            result_data['text'] = link_text
+    else:
+        # No link found, just extract text
+        text = node_text(item_element)
+        if text:
+            result_data['title'] = text
+            result_data['text'] = text
+    
+    # Try to extract status (like "Out", "Final Result", "Start", etc.)
+    if result_data['text']:
+        # Look for common status indicators
+        match = _STATUS_RE.match(result_data['text'])
+        if match:
+            result_data['status'] = match.group(1) if match.group(1) is not None else match.group(2)
+    
+    return result_data
+
+
+def _load_known_list_selectors() -> Dict[str, Dict[str, str]]:
+    """
+    Load the known result-list selectors from known_list_selectors.json next to this script.
+    
+    The file maps a site's host name to the CSS selector of the result items for
+    each section name (lower-case; "" for auto-detection), e.g.
+    {"example.com": {"results": "#results li", "": "#latest li"}}
+    
+    Returns:
+        Dict[str, Dict[str, str]]: The selectors, or an empty dict if the file is missing or invalid
+    """
+    path = os.path.join(os.path.dirname(__file__), 'known_list_selectors.json')
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠ Error loading known_list_selectors.json: {e}")
+        return {}
+
+
+_KNOWN_LIST_SELECTORS = _load_known_list_selectors()
+
+
+def _known_list_selector(url: str, section_name: Optional[str]) -> Optional[str]:
+    """Return the known result-item selector for url's site and section_name, or None."""
+    host = urlparse(url).hostname or ''
+    selectors = _KNOWN_LIST_SELECTORS.get(host) or _KNOWN_LIST_SELECTORS.get(host.removeprefix('www.'))
+    if not selectors:
+        return None
+    return selectors.get((section_name or '').lower())
+
+
+_ATTRIBUTE_SELECTOR_RE = re.compile(r'\[([\w-]+)(\*?)="([^"]*)"\]')
+
+
+def _simple_selector_matcher(selector: str) -> Callable[[str, str, Any], bool]:
+    """
+    Return a (tag name, class attribute, node) -> bool test for a simple CSS selector.
+    
+    Supports 'tag', '.class', '[attr="value"]' and '[attr*="part"]', which covers the
+    fixed card selectors; the node is only read for attributes other than class.
+    """
+    attribute = _ATTRIBUTE_SELECTOR_RE.fullmatch(selector)
+    if attribute:
+        name, contains, value = attribute.groups()
+        if name == 'class':
+            if contains:
+                return lambda tag, classes, node: value in classes
+            return lambda tag, classes, node: classes == value
+        if contains:
+            return lambda tag, classes, node: value in (node_attrs(node).get(name) or '')
+        return lambda tag, classes, node: node_attrs(node).get(name) == value
+    if selector.startswith('.'):
+        class_name = selector[1:]
+        return lambda tag, classes, node: class_name in classes.split()
+    return lambda tag, classes, node: tag == selector
+
+
+_CARD_MATCHERS = tuple(_simple_selector_matcher(selector) for selector in _CARD_SELECTORS)
+_CARD_TITLE_MATCHERS = tuple(_simple_selector_matcher(selector) for selector in _CARD_TITLE_SELECTORS)
+_CARD_DESC_MATCHERS = tuple(_simple_selector_matcher(selector) for selector in _CARD_DESC_SELECTORS)
+
+
+def _first_matching_selector(root, selectors: Tuple[str, ...], matchers: tuple) -> Tuple[Optional[str], list]:
+    """
+    Find the first of selectors that matches anything under root, testing them all in one walk.
+    
+    Gives the same answer as selecting with each selector in turn and stopping at the
+    first non-empty result, without a walk of the document per selector.
+    
+    Args:
+        root: BeautifulSoup Tag or selectolax node to search under
+        selectors (Tuple[str, ...]): Selectors in order of preference
+        matchers (tuple): _simple_selector_matcher of each selector
+        
+    Returns:
+        Tuple[Optional[str], list]: The first matching selector and its matches, or (None, [])
+    """
+    matches = [[] for _ in matchers]
+    # Selectors after the best one matched so far can't win any more
+    bound = len(matchers)
+    for node in _iter_descendants(root):
+        tag = _node_tag(node)
+        classes = _node_class(node)
+        for i in range(bound):
+            if matchers[i](tag, classes, node):
+                matches[i].append(node)
+                bound = i + 1
+                break
+    for selector, found in zip(selectors, matches):
+        if found:
+            return selector, found
+    return None, []
+
+
+def _scan_card(card_element) -> Tuple[Any, str, Any, Any]:
+    """
+    Walk a card once, finding what extract_card_data would otherwise look up with a select per selector.
+    
+    Selectors are tried in order as before: the title is the first match of the first
+    title selector that matches anything, and the description the text of the first
+    description selector whose first match has text. Selectors after the best one
+    found so far are no longer tested.
+    
+    Args:
+        card_element: BeautifulSoup Tag or selectolax node of the card
+        
+    Returns:
+        Tuple[Any, str, Any, Any]: The title element (or None), the description ('' if none),
+        the first <a> with an href (or None) and the first <img> (or None)
+    """
+    title = link = image = None
+    description = ''
+    title_bound = len(_CARD_TITLE_MATCHERS)
+    desc_bound = len(_CARD_DESC_MATCHERS)
+    desc_tried = [False] * desc_bound
+    for node in _iter_descendants(card_element):
+        tag = _node_tag(node)
+        classes = _node_class(node)
+        for i in range(title_bound):
+            if _CARD_TITLE_MATCHERS[i](tag, classes, node):
+                title, title_bound = node, i
+                break
+        for i in range(desc_bound):
+            if not desc_tried[i] and _CARD_DESC_MATCHERS[i](tag, classes, node):
+                desc_tried[i] = True
+                text = node_text(node)
+                if text:
+                    description, desc_bound = text, i
+                    break
+        if link is None and tag == 'a' and 'href' in node_attrs(node):
+            link = node
+        elif image is None and tag == 'img':
+            image = node
+        if not title_bound and not desc_bound and link is not None and image is not None:
+            break
+    return title, description, link, image
+
+
+def _card_strainer(card_selector: str) -> Optional[SoupStrainer]:
+    """Return a SoupStrainer keeping exactly the elements a simple card selector matches, or None if it isn't simple."""
+    match = _SIMPLE_SELECTOR_RE.fullmatch(card_selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    name, class_name, element_id = match.groups()
+    attrs = {}
+    if class_name:
+        # Match one class among several; the strainer sees the raw class attribute while parsing
+        attrs['class'] = re.compile(r'(?:^|\s)' + re.escape(class_name) + r'(?:\s|$)')
+    if element_id:
+        attrs['id'] = element_id
+    return SoupStrainer(name.lower() if name else None, attrs)
+
+
+def _page_root(url: str):
+    """
+    Fetch a webpage and parse it for scrape_result_list and scrape_card_results.
+    
+    Uses selectolax's Lexbor engine when installed; otherwise the shared
+    BeautifulSoup tree from get_page_content. Either way the tree is cached
+    with the page, so repeated scrapes of one URL parse it once.
+    
+    Returns:
+        The root node of the parsed page, or None if error
+    """
+    if not SELECTOLAX_AVAILABLE:
+        return get_page_content(url)
+    
+    response = _fetch_page(url)
+    if response is None:
+        return None
+    try:
+        return _get_lexbor_tree(response).root
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+
+
 def scrape_result_list(url: str, section_name: Optional[str] = None, list_selector: Optional[str] = None) -> Union[List[Dict[str, str]], str]:
     """
     Extract result items from list-based sections (like "Results", "Admit Cards", "Latest Jobs").
@@ -1066,83 +2583,33 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
     Returns:
         Union[List[Dict[str, str]], str]: List of result dictionaries or error message
     """
-    soup = get_page_content(url)
-    if not soup:
+    root = _page_root(url)
+    if root is None:
         return "Error: Could not fetch the webpage"
     
-    def normalize_url(link_url: str, base_url: str) -> str:
-        """Convert relative URLs to absolute URLs."""
-        if not link_url:
-            return ""
-        if link_url.startswith('//'):
-            return 'https:' + link_url
-        elif link_url.startswith('http://') or link_url.startswith('https://'):
-            return link_url
-        elif link_url.startswith('/'):
-            return urljoin(base_url, link_url)
-        elif link_url.startswith('#'):
-            return base_url + link_url
-        else:
-            return urljoin(base_url, link_url)
-    
-    def extract_result_item(item_element) -> Dict[str, str]:
-        """Extract data from a single result list item."""
-        result_data = {
-            'title': '',
-            'link': '',
-            'text': '',
-            'status': ''
-        }
-        
-        # Try to find a link in the item
-        link_elem = item_element.find('a', href=True)
-        
-        if link_elem:
-            # Extract link
-            result_data['link'] = normalize_url(link_elem.get('href'), url)
-            # Extract title/text from link
-            link_text = link_elem.get_text(strip=True)
-            if link_text:
-                result_data['title'] = link_text
-                result_data['text'] = link_text
-        elif item_element.name == 'a' and item_element.get('href'):
-            # The item itself is a link
-            result_data['link'] = normalize_url(item_element.get('href'), url)
-            link_text = item_element.get_text(strip=True)
-            if link_text:
-                result_data['title'] = link_text
-                result_data['text'] = link_text
-        else:
-            # No link found, just extract text
-            text = item_element.get_text(strip=True)
-            if text:
-                result_data['title'] = text
-                result_data['text'] = text
-        
-        # Try to extract status (like "Out", "Final Result", "Start", etc.)
-        if result_data['text']:
-            # Look for common status indicators
-            status_patterns = [
-                r'\s*-\s*(Out|Final Result|Start|Last Date|Date Extend|Reminder|Booking)',
-                r'\((.*?)\)$',  # Text in parentheses at the end
-            ]
-            for pattern in status_patterns:
-                match = re.search(pattern, result_data['text'], re.IGNORECASE)
-                if match:
-                    result_data['status'] = match.group(1) if match.lastindex else match.group(0)
-                    break
-        
-        return result_data
-    
     results = []
     
+    # Sites with a known layout go straight to their result items, skipping the heuristics below
+    if not list_selector:
+        list_selector = _known_list_selector(url, section_name)
+    
     # If a specific selector is provided, use it
     if list_selector:
-        items = soup.select(list_selector)
+        items = None
+        if not isinstance(root, Tag):
+            try:
+                items = _node_select(root, list_selector)
+            except SelectolaxError:
+                # Lexbor doesn't support every selector soupsieve does (e.g. :contains)
+                root = get_page_content(url)
+                if root is None:
+                    return "Error: Could not fetch the webpage"
+        if items is None:
+            items = _node_select(root, list_selector)
         if items:
             print(f"Found {len(items)} items using selector: {list_selector}")
             for idx, item in enumerate(items, 1):
-                result_data = extract_result_item(item)
+                result_data = _extract_result_item(item, url)
                 if result_data['title'] or result_data['text']:
                     result_data['index'] = idx
                     results.append(result_data)
@@ -1154,12 +2621,13 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
         
         # Try multiple methods to find the section
         # Method 1: Find by heading text (h1-h6, div, span with text matching)
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'span', 'strong', 'b', 'p'])
+        headings = _node_find_all(root, ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'span', 'strong', 'b', 'p'))
         target_section = None
         target_list = None
+        document_order = None
         
         for heading in headings:
-            heading_text = heading.get_text(strip=True).lower()
+            heading_text = node_text(heading).lower()
             if section_name_lower in heading_text and len(heading_text) < 50:  # Reasonable heading length
                 # Found the section heading, now find the list container
                 # Method 1a: Check if heading's parent or next sibling has a list
@@ -1169,34 +2637,32 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
                     if current.parent:
                         parent = current.parent
                         # Look for ul/ol directly in parent
-                        list_container = parent.find(['ul', 'ol'])
-                        if list_container:
-                            list_items = list_container.find_all('li', recursive=False)
-                            if list_items and len(list_items) >= 2:
-                                target_list = list_container
-                                print(f"Found section '{section_name}' with {len(list_items)} items (method: parent list)")
-                                break
+                        list_container = _node_find(parent, ('ul', 'ol'))
+                        if list_container is not None and _has_node_children(list_container, ('li',), 2):
+                            target_list = list_container
+                            print(f"Found section '{section_name}' with {len(_node_children(list_container, ('li',)))} items (method: parent list)")
+                            break
                         
                         # Check next siblings for lists
-                        for sibling in parent.find_all_next(['ul', 'ol'], limit=3):
-                            list_items = sibling.find_all('li', recursive=False)
-                            if list_items and len(list_items) >= 2:
+                        if document_order is None:
+                            document_order = _DocumentOrder(root)
+                        for sibling in document_order.following(parent, ('ul', 'ol'), 3):
+                            if _has_node_children(sibling, ('li',), 2):
                                 # Make sure we're not going too far (check if heading is nearby)
-                                if sibling.find_previous(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) == heading:
+                                previous_heading = document_order.preceding(sibling, ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+                                if previous_heading is not None and _node_key(previous_heading) == _node_key(heading):
                                     target_list = sibling
-                                    print(f"Found section '{section_name}' with {len(list_items)} items (method: sibling list)")
+                                    print(f"Found section '{section_name}' with {len(_node_children(sibling, ('li',)))} items (method: sibling list)")
                                     break
                         if target_list:
                             break
                     
                     # Check if current element itself contains a list
-                    list_container = current.find(['ul', 'ol'])
-                    if list_container:
-                        list_items = list_container.find_all('li', recursive=False)
-                        if list_items and len(list_items) >= 2:
-                            target_list = list_container
-                            print(f"Found section '{section_name}' with {len(list_items)} items (method: embedded list)")
-                            break
+                    list_container = _node_find(current, ('ul', 'ol'))
+                    if list_container is not None and _has_node_children(list_container, ('li',), 2):
+                        target_list = list_container
+                        print(f"Found section '{section_name}' with {len(_node_children(list_container, ('li',)))} items (method: embedded list)")
+                        break
                     
                     if current.parent:
                         current = current.parent
@@ -1216,15 +2682,13 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
             ]
             for selector in section_selectors:
                 try:
-                    sections = soup.select(selector)
+                    sections = _node_select(root, selector)
                     for section in sections:
-                        list_container = section.find(['ul', 'ol'])
-                        if list_container:
-                            list_items = list_container.find_all('li', recursive=False)
-                            if list_items and len(list_items) >= 2:
-                                target_list = list_container
-                                print(f"Found section '{section_name}' with {len(list_items)} items (method: class/id selector)")
-                                break
+                        list_container = _node_find(section, ('ul', 'ol'))
+                        if list_container is not None and _has_node_children(list_container, ('li',), 2):
+                            target_list = list_container
+                            print(f"Found section '{section_name}' with {len(_node_children(list_container, ('li',)))} items (method: class/id selector)")
+                            break
                     if target_list:
                         break
                 except:
@@ -1232,12 +2696,12 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
         
         if target_list:
             # Extract all list items from the found list
-            list_items = target_list.find_all('li', recursive=False)
+            list_items = _node_children(target_list, ('li',))
             if not list_items:
-                list_items = target_list.find_all('li', recursive=True)
+                list_items = _node_find_all(target_list, ('li',))
             
             for idx, item in enumerate(list_items, 1):
-                result_data = extract_result_item(item)
+                result_data = _extract_result_item(item, url)
                 if result_data['title'] or result_data['text']:
                     result_data['index'] = idx
                     results.append(result_data)
@@ -1246,23 +2710,36 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
                 return results
     
     # Auto-detect: Try to find common result list patterns
-    # Method 1: Find all ul/ol lists and check if they contain result-like items
-    all_lists = soup.find_all(['ul', 'ol'])
+    # Method 1: Find all ul/ol lists and check if they contain result-like items.
+    # One pass over the list items groups them by list (lists come out in document
+    # order, keyed by their first item) and one pass over the links marks every item
+    # that contains one, instead of searching each list and each item separately.
+    lists_by_key = {}
+    for li in _node_find_all(root, ('li',)):
+        list_elem = li.parent
+        if list_elem is not None and _node_tag(list_elem) in ('ul', 'ol'):
+            lists_by_key.setdefault(_node_key(list_elem), (list_elem, []))[1].append(li)
+    linked_items = set()
+    for link in _node_find_all(root, ('a',)):
+        if 'href' not in node_attrs(link):
+            continue
+        ancestor = link.parent
+        while ancestor is not None:
+            if _node_tag(ancestor) == 'li':
+                linked_items.add(_node_key(ancestor))
+            ancestor = ancestor.parent
     candidate_lists = []
     
-    for list_elem in all_lists:
-        list_items = list_elem.find_all('li', recursive=False)
+    for list_elem, list_items in lists_by_key.values():
         if len(list_items) >= 3:  # At least 3 items to be considered a result list
             # Check if items have links (common in result lists)
-            links_count = sum(1 for li in list_items if li.find('a', href=True))
+            links_count = sum(1 for li in list_items if _node_key(li) in linked_items)
             link_ratio = links_count / len(list_items) if list_items else 0
             
             # Check if list items contain result-like keywords
-            result_keywords = ['result', 'admit', 'card', 'exam', 'job', 'notification', 'form', 'out', 'start']
             keyword_matches = 0
             for li in list_items[:5]:  # Check first 5 items
-                li_text = li.get_text(strip=True).lower()
-                if any(keyword in li_text for keyword in result_keywords):
+                if _RESULT_KEYWORD_RE.search(node_text(li).lower()):
                     keyword_matches += 1
             
             # Score the list based on criteria
@@ -1287,7 +2764,7 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
         best_list, list_items, score = candidate_lists[0]
         print(f"Auto-detected result list with {len(list_items)} items (score: {score})")
         for idx, item in enumerate(list_items, 1):
-            result_data = extract_result_item(item)
+            result_data = _extract_result_item(item, url)
             if result_data['title'] or result_data['text']:
                 result_data['index'] = idx
                 results.append(result_data)
@@ -1296,26 +2773,28 @@ def scrape_result_list(url: str, section_name: Optional[str] = None, list_select
     
     # Method 2: Find sections with headings containing "result", "admit", "job", etc.
     section_keywords = ['result', 'admit', 'job', 'notification', 'exam', 'recruitment']
-    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'div', 'span'], 
-                            class_=re.compile(r'title|heading|header', re.I))
+    headings = [
+        heading for heading in _node_find_all(root, ('h1', 'h2', 'h3', 'h4', 'div', 'span'))
+        if _CLASS_HEAD_RE.search(_node_class(heading))
+    ]
     
     for heading in headings:
-        heading_text = heading.get_text(strip=True).lower()
+        heading_text = node_text(heading).lower()
         if any(keyword in heading_text for keyword in section_keywords):
             # Find nearby list
             parent = heading.parent
             for _ in range(4):
                 if parent:
-                    list_items = parent.find_all(['li', 'a'], recursive=False)
+                    list_items = _node_children(parent, ('li', 'a'))
                     if not list_items:
-                        list_container = parent.find(['ul', 'ol'])
-                        if list_container:
-                            list_items = list_container.find_all('li', recursive=False)
+                        list_container = _node_find(parent, ('ul', 'ol'))
+                        if list_container is not None:
+                            list_items = _node_children(list_container, ('li',))
                     
                     if list_items and len(list_items) >= 3:
-                        print(f"Found result section near heading: {heading.get_text(strip=True)}")
+                        print(f"Found result section near heading: {node_text(heading)}")
                         for idx, item in enumerate(list_items, 1):
-                            result_data = extract_result_item(item)
+                            result_data = _extract_result_item(item, url)
                             if result_data['title'] or result_data['text']:
                                 result_data['index'] = idx
                                 results.append(result_data)
@@ -1343,38 +2822,15 @@ def scrape_card_results(url: str, card_selector: Optional[str] = None) -> Union[
     Returns:
         Union[List[Dict[str, str]], str]: List of card dictionaries or error message
     """
-    soup = get_page_content(url)
-    if not soup:
+    if SELECTOLAX_AVAILABLE:
+        root = _page_root(url)
+    else:
+        # Only build the elements that can be cards; the rest of the page is never needed
+        strainer = _card_strainer(card_selector) if card_selector else _CARD_STRAINER
+        root = get_page_content(url, parse_only=strainer) if strainer else get_page_content(url)
+    if root is None:
         return "Error: Could not fetch the webpage"
     
-    def normalize_url(link_url: str, base_url: str) -> str:
-        """Convert relative URLs to absolute URLs."""
-        if not link_url:
-            return ""
-        if link_url.startswith('//'):
-            return 'https:' + link_url
-        elif link_url.startswith('http://') or link_url.startswith('https://'):
-            return link_url
-        elif link_url.startswith('/'):
-            return urljoin(base_url, link_url)
-        elif link_url.startswith('#'):
-            return base_url + link_url
-        else:
-            return urljoin(base_url, link_url)
-    
-    def normalize_image_url(img_url: str, base_url: str) -> str:
-        """Convert relative image URLs to absolute URLs."""
-        if not img_url:
-            return ""
-        if img_url.startswith('//'):
-            return 'https:' + img_url
-        elif img_url.startswith('http://') or img_url.startswith('https://'):
-            return img_url
-        elif img_url.startswith('/'):
-            return urljoin(base_url, img_url)
-        else:
-            return urljoin(base_url, img_url)
-    
     def extract_card_data(card_element) -> Dict[str, str]:
         """Extract structured data from a single card element."""
         card_data = {
@@ -1385,64 +2841,52 @@ def scrape_card_results(url: str, card_selector: Optional[str] = None) -> Union[
             'text': ''
         }
         
+        title_elem, description, link_elem, img_elem = _scan_card(card_element)
+        
         # Extract title (try common title selectors)
-        title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '[class*="title"]', '[class*="name"]', '.card-title', '.result-title']
-        for selector in title_selectors:
-            title_elem = card_element.select_one(selector)
-            if title_elem:
-                card_data['title'] = title_elem.get_text(strip=True)
-                break
+        if title_elem:
+            card_data['title'] = node_text(title_elem)
         
         # Extract link (from anchor tag or card itself)
-        link_elem = card_element.find('a', href=True)
         if link_elem:
-            card_data['link'] = normalize_url(link_elem.get('href'), url)
-        elif card_element.name == 'a' and card_element.get('href'):
-            card_data['link'] = normalize_url(card_element.get('href'), url)
+            card_data['link'] = _normalize_url(node_attrs(link_elem).get('href'), url)
+        elif _node_tag(card_element) == 'a' and node_attrs(card_element).get('href'):
+            card_data['link'] = _normalize_url(node_attrs(card_element).get('href'), url)
         
         # Extract image
-        img_elem = card_element.find('img')
         if img_elem:
-            img_url = (img_elem.get('src') or 
-                      img_elem.get('data-src') or 
-                      img_elem.get('data-lazy-src') or
-                      img_elem.get('data-original') or
-                      img_elem.get('data-url'))
+            img_url = _first_src(node_attrs(img_elem))
             if img_url:
-                card_data['image'] = normalize_image_url(img_url, url)
+                card_data['image'] = _normalize_image_url(img_url, url)
         
         # Extract description/text (try common description selectors)
-        desc_selectors = ['.description', '.desc', '[class*="desc"]', 'p', '.text', '[class*="text"]', '.summary', '[class*="summary"]']
-        for selector in desc_selectors:
-            desc_elem = card_element.select_one(selector)
-            if desc_elem and desc_elem.get_text(strip=True):
-                card_data['description'] = desc_elem.get_text(strip=True)
-                break
+        card_data['description'] = description
+        
+        # The card's text, collected once for the fallbacks below
+        text_pieces = None
         
         # If no description found, get all text content (excluding title)
         if not card_data['description']:
-            # Get all text from the card
-            all_text = card_element.get_text(separator=' ', strip=True)
-            # Remove the title from the text if we found one
-            if card_data['title']:
-                all_text = all_text.replace(card_data['title'], '', 1).strip()
+            # Get all text from the card, leaving out the title element's own text if we found one
+            # (rather than the first place the title's text happens to occur)
+            text_pieces = _node_text_pieces(card_element, exclude=title_elem if card_data['title'] else None)
+            all_text = ' '.join(text_pieces)
             # Clean up extra whitespace
-            text_words = all_text.split()
-            if text_words:
-                card_data['description'] = ' '.join(text_words[:50])  # First 50 words
-                card_data['text'] = ' '.join(text_words)
-            else:
-                card_data['text'] = all_text
+            card_data['text'] = ' '.join(all_text.split())
+            # First 50 words, splitting off no more of the (now single-spaced) text than that
+            card_data['description'] = ' '.join(card_data['text'].split(' ', 50)[:50])
         else:
             card_data['text'] = card_data['description']
         
         # If no title found, try to get it from link text or first heading
         if not card_data['title']:
             if link_elem:
-                card_data['title'] = link_elem.get_text(strip=True)
+                card_data['title'] = node_text(link_elem)
             else:
                 # Get first significant text
-                first_text = card_element.get_text(strip=True).split('\n')[0].strip()
+                if text_pieces is None:
+                    text_pieces = _node_text_pieces(card_element)
+                first_text = ''.join(text_pieces).split('\n')[0].strip()
                 if first_text and len(first_text) < 100:
                     card_data['title'] = first_text[:100]
         
@@ -1452,33 +2896,36 @@ def scrape_card_results(url: str, card_selector: Optional[str] = None) -> Union[
     card_elements = []
     
     if card_selector:
-        card_elements = soup.select(card_selector)
+        if not isinstance(root, Tag):
+            try:
+                card_elements = _node_select(root, card_selector)
+            except SelectolaxError:
+                # Lexbor doesn't support every selector soupsieve does (e.g. :contains)
+                root = get_page_content(url)
+                if root is None:
+                    return "Error: Could not fetch the webpage"
+        if isinstance(root, Tag):
+            card_elements = _node_select(root, card_selector)
     else:
         # Try common card selectors
-        common_selectors = [
-            '.card',
-            '.result-card',
-            '.item-card',
-            '.card-item',
-            '[class*="card"]',
-            '.result-item',
-            '.item',
-            '[class*="result"]',
-            '.product-card',
-            '.product-item',
-            '[data-testid*="card"]',
-            '[class*="grid-item"]',
-            '.search-result',
-            '[class*="search-result"]',
-            'article',
-            '[role="article"]'
-        ]
-        
-        for selector in common_selectors:
-            card_elements = soup.select(selector)
-            if card_elements:
-                print(f"Found {len(card_elements)} cards using selector: {selector}")
-                break
+        if isinstance(root, Tag):
+            # BeautifulSoup selects in Python, so test every selector in one walk instead of one walk each
+            strained = len(_STRAINED_CARD_SELECTORS)
+            selector, card_elements = _first_matching_selector(root, _CARD_SELECTORS[:strained], _CARD_MATCHERS[:strained])
+            if not card_elements:
+                # The strained parse only holds class-based matches; the remaining selectors need the whole page
+                root = get_page_content(url)
+                if root is None:
+                    return "Error: Could not fetch the webpage"
+                selector, card_elements = _first_matching_selector(root, _CARD_SELECTORS[strained:], _CARD_MATCHERS[strained:])
+        else:
+            # Lexbor runs each selector in C and usually stops at the first
+            for selector in _CARD_SELECTORS:
+                card_elements = _node_select(root, selector)
+                if card_elements:
+                    break
+        if card_elements:
+            print(f"Found {len(card_elements)} cards using selector: {selector}")
     
     if not card_elements:
         return "No cards found. Try specifying a custom CSS selector for the card elements."
@@ -1498,6 +2945,16 @@ def scrape_card_results(url: str, card_selector: Optional[str] = None) -> Union[
     return cards_data
 
 
+# Rule printed above and below each block of results
+_SEP = "=" * 60
+_FOOTER = f"{_SEP}\n\n"
+
+
+def _banner(heading: str) -> str:
+    """Return a heading framed by _SEP rules, as printed at the top of each block of output."""
+    return f"\n{_SEP}\n{heading}\n{_SEP}\n"
+
+
 def print_result(data_type: str, result: Union[str, List[str], None]):
     """
     Print the extracted result in a clean format.
@@ -1506,22 +2963,23 @@ def print_result(data_type: str, result: Union[str, List[str], None]):
         data_type (str): Type of data extracted
         result: The extracted data
     """
-    print("\n" + "="*60)
-    print(f"EXTRACTED {data_type.upper()}:")
-    print("="*60)
+    # Build the whole block and write it once rather than print line by line
+    parts = [_banner(f"EXTRACTED {data_type.upper()}:")]
+    append = parts.append
     
     if result is None:
-        print("Error: Could not extract data")
+        append("Error: Could not extract data\n")
     elif isinstance(result, list):
         if len(result) == 1:
-            print(result[0])
+            append(f"{result[0]}\n")
         else:
             for i, item in enumerate(result, 1):
-                print(f"{i}. {item}")
+                append(f"{i}. {item}\n")
     else:
-        print(result)
+        append(f"{result}\n")
     
-    print("="*60 + "\n")
+    append(_FOOTER)
+    sys.stdout.write(''.join(parts))
 
 
 def print_result_list(results: Union[List[Dict[str, str]], str]):
@@ -1531,30 +2989,30 @@ def print_result_list(results: Union[List[Dict[str, str]], str]):
     Args:
         results: List of result dictionaries or error message
     """
-    print("\n" + "="*60)
-    print("EXTRACTED RESULT LIST:")
-    print("="*60)
+    parts = [_banner("EXTRACTED RESULT LIST:")]
+    append = parts.append
     
     if isinstance(results, str):
-        print(results)
+        append(f"{results}\n")
     elif isinstance(results, list):
-        print(f"\nFound {len(results)} result(s):\n")
+        append(f"\nFound {len(results)} result(s):\n\n")
         for result in results:
             idx = result.get('index', '?')
             title = result.get('title', result.get('text', ''))
             link = result.get('link', '')
             status = result.get('status', '')
             
-            print(f"{idx}. {title}")
+            append(f"{idx}. {title}\n")
             if status:
-                print(f"   Status: {status}")
+                append(f"   Status: {status}\n")
             if link:
-                print(f"   Link: {link}")
-            print()
+                append(f"   Link: {link}\n")
+            append("\n")
     else:
-        print("Error: Invalid result data format")
+        append("Error: Invalid result data format\n")
     
-    print("="*60 + "\n")
+    append(_FOOTER)
+    sys.stdout.write(''.join(parts))
 
 
 def print_card_results(cards: Union[List[Dict[str, str]], str]):
@@ -1564,346 +3022,320 @@ def print_card_results(cards: Union[List[Dict[str, str]], str]):
     Args:
         cards: List of card dictionaries or error message
     """
-    print("\n" + "="*60)
-    print("EXTRACTED CARD RESULTS:")
-    print("="*60)
+    parts = [_banner("EXTRACTED CARD RESULTS:")]
+    append = parts.append
     
     if isinstance(cards, str):
-        print(cards)
+        append(f"{cards}\n")
     elif isinstance(cards, list):
-        print(f"\nFound {len(cards)} card(s):\n")
+        append(f"\nFound {len(cards)} card(s):\n\n")
         for card in cards:
-            print(f"Card #{card.get('index', '?')}:")
+            append(f"Card #{card.get('index', '?')}:\n")
             if card.get('title'):
-                print(f"  Title: {card['title']}")
-            if card.get('description'):
-                print(f"  Description: {card['description'][:100]}..." if len(card['description']) > 100 else f"  Description: {card['description']}")
+                append(f"  Title: {card['title']}\n")
+            description = card.get('description')
+            if description:
+                ellipsis = "..." if len(description) > 100 else ""
+                append(f"  Description: {description[:100]}{ellipsis}\n")
             if card.get('link'):
-                print(f"  Link: {card['link']}")
+                append(f"  Link: {card['link']}\n")
             if card.get('image'):
-                print(f"  Image: {card['image']}")
-            print()
+                append(f"  Image: {card['image']}\n")
+            append("\n")
     else:
-        print("Error: Invalid card data format")
+        append("Error: Invalid card data format\n")
     
-    print("="*60 + "\n")
+    append(_FOOTER)
+    sys.stdout.write(''.join(parts))
 
 
-def main():
-    """
-    Interactive main function that prompts user for URL and extraction options.
+def save_json(filename: str, data) -> None:
     """
-    print("\n" + "="*60)
-    print("WEB SCRAPER - Interactive Mode")
-    print("="*60)
+    Write data to a file as indented UTF-8 JSON.
     
-    # Get URL from user
-    url = input("\nEnter the URL to scrape: ").strip()
-    if not url:
-        print("Error: URL cannot be empty!")
+    Uses orjson (C) when installed, which is much faster than the json module
+    for large result sets; the output is the same either way.
+    
+    Args:
+        filename (str): Path of the file to write
+        data: JSON-serializable data, e.g. a list of card or result dictionaries
+    """
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _search_by_keyword(url: str, data_type: str, search: Callable[[str, str], Any]):
+    """Prompt for a keyword, run search(url, keyword) and print the result."""
+    keyword = input("\nEnter the keyword to search for: ").strip()
+    if keyword:
+        result = search(url, keyword)
+        print_result(data_type, result)
+    else:
+        print("Error: Keyword cannot be empty!")
+
+
+def _scrape_with_selector(url: str, data_type: str, scrape: Callable[[str, Optional[str]], Any], examples: str):
+    """Prompt for a CSS selector (empty for the default one), run scrape(url, selector) and print the result."""
+    selector = input(f"Enter CSS selector (e.g., {examples}): ").strip()
+    result = scrape(url, selector if selector else None)
+    print_result(data_type, result)
+
+
+def _scrape_default(url: str, data_type: str, scrape: Callable[[str, Optional[str]], Any]):
+    """Run scrape(url, None) with its default selectors and print the result."""
+    result = scrape(url, None)
+    print_result(data_type, result)
+
+
+def _text_by_topic(url: str):
+    """Prompt for a topic query (and an API key if none is configured) and print the AI answer."""
+    if not OPENAI_AVAILABLE:
+        print("\nError: OpenAI library is not installed.")
+        print("Please install it with: pip install openai")
+        print("Then set your API key as an environment variable: export OPENAI_API_KEY='your-key-here'")
         return
     
-    # Add https:// if not present
-    if not url.startswith('http://') and not url.startswith('https://'):
-        url = 'https://' + url
+    topic_query = input("\nEnter your topic query (e.g., 'Summarize the latest developments on Tesla's Gigafactories'): ").strip()
+    if not topic_query:
+        print("Error: Topic query cannot be empty!")
+        return
     
-    # Ask what to extract
-    print("\nWhat would you like to extract?")
-    print("1. Text")
-    print("2. Image")
-    print("3. Link")
-    print("4. All (Text, Image, and Link)")
-    print("5. Card Results (extract structured data from card-based layouts)")
-    print("6. Result List (extract results from list-based sections like 'Results', 'Admit Cards')")
-    
-    choice = input("\nEnter your choice (1-6): ").strip()
-    
-    # Handle Text extraction
-    if choice == '1':
-        print("\nHow would you like to search for text?")
-        print("1. Search by keyword (e.g., 'about us', 'notice', 'alert')")
-        print("2. Use CSS selector")
-        print("3. Get default text (first heading)")
-        print("4. Search by AI Topic Query (e.g., 'Tesla Gigafactories', 'latest news about AI')")
-        
-        text_choice = input("\nEnter your choice (1-4): ").strip()
-        
-        if text_choice == '1':
-            keyword = input("\nEnter the keyword to search for: ").strip()
-            if keyword:
-                result = search_text_by_keyword(url, keyword)
-                print_result('text', result)
-            else:
-                print("Error: Keyword cannot be empty!")
-        
-        elif text_choice == '2':
-            selector = input("Enter CSS selector (e.g., 'h1.title', '.product-title'): ").strip()
-            result = scrape_text_with_selector(url, selector if selector else None)
-            print_result('text', result)
-        
-        elif text_choice == '3':
-            result = scrape_text_with_selector(url, None)
-            print_result('text', result)
-        
-        elif text_choice == '4':
-            if not OPENAI_AVAILABLE:
-                print("\nError: OpenAI library is not installed.")
-                print("Please install it with: pip install openai")
-                print("Then set your API key as an environment variable: export OPENAI_API_KEY='your-key-here'")
-            else:
-                topic_query = input("\nEnter your topic query (e.g., 'Summarize the latest developments on Tesla's Gigafactories'): ").strip()
-                if topic_query:
-                    # Check for API key in environment or ask user
-                    api_key = os.getenv('OPENAI_API_KEY')
-                    if not api_key:
-                        use_custom_key = input("OpenAI API key not found in environment. Enter API key now? (y/n): ").strip().lower()
-                        if use_custom_key == 'y':
-                            api_key = input("Enter your OpenAI API key: ").strip()
-                        else:
-                            api_key = None
-                    
-                    result = ai_scrape_topic(url, topic_query, api_key)
-                    print_result('text', result)
-                else:
-                    print("Error: Topic query cannot be empty!")
-        
+    # Check for API key in environment or ask user
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        use_custom_key = input("OpenAI API key not found in environment. Enter API key now? (y/n): ").strip().lower()
+        if use_custom_key == 'y':
+            api_key = input("Enter your OpenAI API key: ").strip()
         else:
-            print("Invalid choice!")
-    
-    # Handle Image extraction
-    elif choice == '2':
-        print("\nHow would you like to search for images?")
-        print("1. Search by keyword (e.g., 'logo', 'product', 'banner')")
-        print("2. List all images and select by number")
-        print("3. Use CSS selector")
-        print("4. Get default image (first main image)")
-        
-        image_choice = input("\nEnter your choice (1-4): ").strip()
-        
-        if image_choice == '1':
-            keyword = input("\nEnter the keyword to search for: ").strip()
-            if keyword:
-                result = search_image_by_keyword(url, keyword)
+            api_key = None
+    
+    result = ai_scrape_topic(url, topic_query, api_key)
+    print_result('text', result)
+
+
+def _image_from_list(url: str):
+    """List every image on the page and print the one (or all) the user picks."""
+    print("\nFetching all images from the page...")
+    images = list_all_images(url)
+    
+    if not images:
+        print("No images found on the page.")
+        return
+    
+    print(f"\nFound {len(images)} image(s):\n")
+    for img in images:
+        print(f"{img['index']}. Alt: {img['alt'][:50]}...")
+        print(f"   Title: {img['title'][:50]}...")
+        print(f"   URL: {img['url'][:80]}...")
+        print()
+    
+    selection = input(f"Enter the image number (1-{len(images)}) or 'all' for all images: ").strip()
+    
+    if selection.lower() == 'all':
+        result = [img['url'] for img in images]
+        print_result('image', result)
+    else:
+        try:
+            img_num = int(selection)
+            if 1 <= img_num <= len(images):
+                result = images[img_num - 1]['url']
                 print_result('image', result)
             else:
-                print("Error: Keyword cannot be empty!")
-        
-        elif image_choice == '2':
-            print("\nFetching all images from the page...")
-            images = list_all_images(url)
-            
-            if images:
-                print(f"\nFound {len(images)} image(s):\n")
-                for img in images:
-                    print(f"{img['index']}. Alt: {img['alt'][:50]}...")
-                    print(f"   Title: {img['title'][:50]}...")
-                    print(f"   URL: {img['url'][:80]}...")
-                    print()
-                
-                selection = input(f"Enter the image number (1-{len(images)}) or 'all' for all images: ").strip()
-                
-                if selection.lower() == 'all':
-                    result = [img['url'] for img in images]
-                    print_result('image', result)
-                else:
-                    try:
-                        img_num = int(selection)
-                        if 1 <= img_num <= len(images):
-                            result = images[img_num - 1]['url']
-                            print_result('image', result)
-                        else:
-                            print(f"Error: Please enter a number between 1 and {len(images)}")
-                    except ValueError:
-                        print("Error: Please enter a valid number or 'all'")
-            else:
-                print("No images found on the page.")
-        
-        elif image_choice == '3':
-            selector = input("Enter CSS selector (e.g., '.product-image img', '#main-img'): ").strip()
-            result = scrape_image_with_selector(url, selector if selector else None)
-            print_result('image', result)
-        
-        elif image_choice == '4':
-            result = scrape_image_with_selector(url, None)
-            print_result('image', result)
-        
-        else:
-            print("Invalid choice!")
-    
-    # Handle Link extraction
-    elif choice == '3':
-        print("\nHow would you like to search for links?")
-        print("1. Search by keyword (e.g., 'contact', 'buy', 'cart')")
-        print("2. Use CSS selector")
-        print("3. Get default link (first link)")
-        
-        link_choice = input("\nEnter your choice (1-3): ").strip()
-        
-        if link_choice == '1':
-            keyword = input("\nEnter the keyword to search for: ").strip()
-            if keyword:
-                result = search_link_by_keyword(url, keyword)
-                print_result('link', result)
-            else:
-                print("Error: Keyword cannot be empty!")
-        
-        elif link_choice == '2':
-            selector = input("Enter CSS selector (e.g., 'a.button', '#buy-now'): ").strip()
-            result = scrape_link_with_selector(url, selector if selector else None)
-            print_result('link', result)
-        
-        elif link_choice == '3':
-            result = scrape_link_with_selector(url, None)
-            print_result('link', result)
-        
-        else:
-            print("Invalid choice!")
+                print(f"Error: Please enter a number between 1 and {len(images)}")
+        except ValueError:
+            print("Error: Please enter a valid number or 'all'")
+
+
+def _extract_all(url: str):
+    """Prompt for a text, image and link keyword, run the three extractions together and print them."""
+    print("\nExtracting all data types...")
     
-    # Handle All extraction
-    elif choice == '4':
-        print("\nExtracting all data types...")
-        
-        # Text
-        print("\n--- TEXT EXTRACTION ---")
-        text_keyword = input("Enter keyword to search for text (or press Enter for default): ").strip()
+    # Ask for all three keywords first, so the extractions can run together
+    print("\n--- TEXT EXTRACTION ---")
+    text_keyword = input("Enter keyword to search for text (or press Enter for default): ").strip()
+    
+    print("\n--- IMAGE EXTRACTION ---")
+    image_keyword = input("Enter keyword to search for image (or press Enter for default): ").strip()
+    
+    print("\n--- LINK EXTRACTION ---")
+    link_keyword = input("Enter keyword to search for link (or press Enter for default): ").strip()
+    
+    # Download the page once up front; the three extractions then share it from the page cache
+    _fetch_page(url)
+    with ThreadPoolExecutor(max_workers=3) as executor:
         if text_keyword:
-            text_result = search_text_by_keyword(url, text_keyword)
+            text_future = executor.submit(search_text_by_keyword, url, text_keyword)
         else:
-            text_result = scrape_text_with_selector(url, None)
-        
-        # Image
-        print("\n--- IMAGE EXTRACTION ---")
-        image_keyword = input("Enter keyword to search for image (or press Enter for default): ").strip()
+            text_future = executor.submit(scrape_text_with_selector, url, None)
         if image_keyword:
-            image_result = search_image_by_keyword(url, image_keyword)
+            image_future = executor.submit(search_image_by_keyword, url, image_keyword)
         else:
-            image_result = scrape_image_with_selector(url, None)
-        
-        # Link
-        print("\n--- LINK EXTRACTION ---")
-        link_keyword = input("Enter keyword to search for link (or press Enter for default): ").strip()
+            image_future = executor.submit(scrape_image_with_selector, url, None)
         if link_keyword:
-            link_result = search_link_by_keyword(url, link_keyword)
-        else:
-            link_result = scrape_link_with_selector(url, None)
-        
-        # Display results
-        print("\n" + "="*60)
-        print("EXTRACTED DATA:")
-        print("="*60)
-        print(f"\nTEXT:")
-        if isinstance(text_result, list):
-            for i, item in enumerate(text_result, 1):
-                print(f"  {i}. {item}")
+            link_future = executor.submit(search_link_by_keyword, url, link_keyword)
         else:
-            print(f"  {text_result}")
-        
-        print(f"\nIMAGE:")
-        if isinstance(image_result, list):
-            for i, item in enumerate(image_result, 1):
-                print(f"  {i}. {item}")
-        else:
-            print(f"  {image_result}")
-        
-        print(f"\nLINK:")
-        if isinstance(link_result, list):
-            for i, item in enumerate(link_result, 1):
+            link_future = executor.submit(scrape_link_with_selector, url, None)
+    
+    # Display results
+    sys.stdout.write(_banner("EXTRACTED DATA:"))
+    for label, future in (("TEXT", text_future), ("IMAGE", image_future), ("LINK", link_future)):
+        print(f"\n{label}:")
+        result = future.result()
+        if isinstance(result, list):
+            for i, item in enumerate(result, 1):
                 print(f"  {i}. {item}")
         else:
-            print(f"  {link_result}")
-        print("="*60 + "\n")
-    
-    # Handle Card Results extraction
-    elif choice == '5':
-        print("\nExtracting card-based results...")
-        print("The script will automatically detect card elements on the page.")
-        print("If no cards are found, you can specify a custom CSS selector.")
-        
-        use_custom = input("\nDo you want to specify a custom CSS selector for cards? (y/n): ").strip().lower()
-        card_selector = None
-        
-        if use_custom == 'y':
-            card_selector = input("Enter CSS selector for card elements (e.g., '.card', '.result-item', '#results .item'): ").strip()
-            if not card_selector:
-                card_selector = None
-                print("No selector provided, using automatic detection...")
-        
-        result = scrape_card_results(url, card_selector)
-        print_card_results(result)
-        
-        # Option to save results to JSON
-        if isinstance(result, list) and len(result) > 0:
-            save_json = input("\nDo you want to save the results to a JSON file? (y/n): ").strip().lower()
-            if save_json == 'y':
-                filename = input("Enter filename (without extension, default: card_results): ").strip()
-                if not filename:
-                    filename = "card_results"
-                if not filename.endswith('.json'):
-                    filename += '.json'
-                
-                try:
-                    # Convert to JSON-serializable format
-                    json_data = []
-                    for card in result:
-                        json_card = dict(card)  # Create a copy of the card dictionary
-                        json_data.append(json_card)
-                    
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(json_data, f, indent=2, ensure_ascii=False)
-                    print(f"✓ Results saved to {filename}")
-                except Exception as e:
-                    print(f"Error saving file: {e}")
-    
-    # Handle Result List extraction
-    elif choice == '6':
-        print("\nExtracting result list from list-based sections...")
-        print("This is perfect for websites like Sarkari Result that show results as lists.")
-        
-        use_section = input("\nDo you want to extract a specific section? (y/n): ").strip().lower()
-        section_name = None
-        list_selector = None
-        
-        if use_section == 'y':
-            section_name = input("Enter section name (e.g., 'Results', 'Admit Cards', 'Latest Jobs'): ").strip()
-            if not section_name:
-                section_name = None
-                print("No section name provided, will try auto-detection...")
-        else:
-            use_selector = input("Do you want to specify a CSS selector for list items? (y/n): ").strip().lower()
-            if use_selector == 'y':
-                list_selector = input("Enter CSS selector (e.g., 'ul li', '.result-list li', '#results li'): ").strip()
-                if not list_selector:
-                    list_selector = None
-                    print("No selector provided, using auto-detection...")
-        
-        result = scrape_result_list(url, section_name, list_selector)
-        print_result_list(result)
-        
-        # Option to save results to JSON
-        if isinstance(result, list) and len(result) > 0:
-            save_json = input("\nDo you want to save the results to a JSON file? (y/n): ").strip().lower()
-            if save_json == 'y':
-                filename = input("Enter filename (without extension, default: result_list): ").strip()
-                if not filename:
-                    filename = "result_list"
-                if not filename.endswith('.json'):
-                    filename += '.json'
-                
-                try:
-                    # Convert to JSON-serializable format
-                    json_data = []
-                    for item in result:
-                        json_item = dict(item)
-                        json_data.append(json_item)
-                    
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(json_data, f, indent=2, ensure_ascii=False)
-                    print(f"✓ Results saved to {filename}")
-                except Exception as e:
-                    print(f"Error saving file: {e}")
+            print(f"  {result}")
+    sys.stdout.write(_FOOTER)
+
+
+def _offer_json_save(results, default_name: str):
+    """Offer to save a non-empty list of results to a JSON file."""
+    if not (isinstance(results, list) and len(results) > 0):
+        return
+    save = input("\nDo you want to save the results to a JSON file? (y/n): ").strip().lower()
+    if save != 'y':
+        return
+    filename = input(f"Enter filename (without extension, default: {default_name}): ").strip()
+    if not filename:
+        filename = default_name
+    if not filename.endswith('.json'):
+        filename += '.json'
     
+    try:
+        save_json(filename, results)
+        print(f"✓ Results saved to {filename}")
+    except Exception as e:
+        print(f"Error saving file: {e}")
+
+
+def _extract_cards(url: str):
+    """Extract card-based results, optionally with a user-given card selector, and offer to save them."""
+    print("\nExtracting card-based results...")
+    print("The script will automatically detect card elements on the page.")
+    print("If no cards are found, you can specify a custom CSS selector.")
+    
+    use_custom = input("\nDo you want to specify a custom CSS selector for cards? (y/n): ").strip().lower()
+    card_selector = None
+    
+    if use_custom == 'y':
+        card_selector = input("Enter CSS selector for card elements (e.g., '.card', '.result-item', '#results .item'): ").strip()
+        if not card_selector:
+            card_selector = None
+            print("No selector provided, using automatic detection...")
+    
+    result = scrape_card_results(url, card_selector)
+    print_card_results(result)
+    _offer_json_save(result, "card_results")
+
+
+def _extract_result_list(url: str):
+    """Extract a result list, by section name or list selector, and offer to save it."""
+    print("\nExtracting result list from list-based sections...")
+    print("This is perfect for websites like Sarkari Result that show results as lists.")
+    
+    use_section = input("\nDo you want to extract a specific section? (y/n): ").strip().lower()
+    section_name = None
+    list_selector = None
+    
+    if use_section == 'y':
+        section_name = input("Enter section name (e.g., 'Results', 'Admit Cards', 'Latest Jobs'): ").strip()
+        if not section_name:
+            section_name = None
+            print("No section name provided, will try auto-detection...")
     else:
-        print("Invalid choice! Please run the script again and select 1-6.")
+        use_selector = input("Do you want to specify a CSS selector for list items? (y/n): ").strip().lower()
+        if use_selector == 'y':
+            list_selector = input("Enter CSS selector (e.g., 'ul li', '.result-list li', '#results li'): ").strip()
+            if not list_selector:
+                list_selector = None
+                print("No selector provided, using auto-detection...")
+    
+    result = scrape_result_list(url, section_name, list_selector)
+    print_result_list(result)
+    _offer_json_save(result, "result_list")
+
+
+# Menu option -> (label, handler(url)), in the order they are listed
+_MenuActions = Dict[str, Tuple[str, Callable[[str], None]]]
+
+_TEXT_ACTIONS: _MenuActions = {
+    '1': ("Search by keyword (e.g., 'about us', 'notice', 'alert')",
+          lambda url: _search_by_keyword(url, 'text', search_text_by_keyword)),
+    '2': ("Use CSS selector",
+          lambda url: _scrape_with_selector(url, 'text', scrape_text_with_selector, "'h1.title', '.product-title'")),
+    '3': ("Get default text (first heading)",
+          lambda url: _scrape_default(url, 'text', scrape_text_with_selector)),
+    '4': ("Search by AI Topic Query (e.g., 'Tesla Gigafactories', 'latest news about AI')", _text_by_topic),
+}
+
+_IMAGE_ACTIONS: _MenuActions = {
+    '1': ("Search by keyword (e.g., 'logo', 'product', 'banner')",
+          lambda url: _search_by_keyword(url, 'image', search_image_by_keyword)),
+    '2': ("List all images and select by number", _image_from_list),
+    '3': ("Use CSS selector",
+          lambda url: _scrape_with_selector(url, 'image', scrape_image_with_selector, "'.product-image img', '#main-img'")),
+    '4': ("Get default image (first main image)",
+          lambda url: _scrape_default(url, 'image', scrape_image_with_selector)),
+}
+
+_LINK_ACTIONS: _MenuActions = {
+    '1': ("Search by keyword (e.g., 'contact', 'buy', 'cart')",
+          lambda url: _search_by_keyword(url, 'link', search_link_by_keyword)),
+    '2': ("Use CSS selector",
+          lambda url: _scrape_with_selector(url, 'link', scrape_link_with_selector, "'a.button', '#buy-now'")),
+    '3': ("Get default link (first link)",
+          lambda url: _scrape_default(url, 'link', scrape_link_with_selector)),
+}
+
+
+def _run_menu(url: str, question: str, actions: _MenuActions, invalid_message: str = "Invalid choice!"):
+    """Print a numbered menu, read the user's choice and run its handler on url."""
+    print(f"\n{question}")
+    for key, (label, _) in actions.items():
+        print(f"{key}. {label}")
+    
+    choice = input(f"\nEnter your choice (1-{len(actions)}): ").strip()
+    action = actions.get(choice)
+    if action is None:
+        print(invalid_message)
+        return
+    action[1](url)
+
+
+_MAIN_ACTIONS: _MenuActions = {
+    '1': ("Text", lambda url: _run_menu(url, "How would you like to search for text?", _TEXT_ACTIONS)),
+    '2': ("Image", lambda url: _run_menu(url, "How would you like to search for images?", _IMAGE_ACTIONS)),
+    '3': ("Link", lambda url: _run_menu(url, "How would you like to search for links?", _LINK_ACTIONS)),
+    '4': ("All (Text, Image, and Link)", _extract_all),
+    '5': ("Card Results (extract structured data from card-based layouts)", _extract_cards),
+    '6': ("Result List (extract results from list-based sections like 'Results', 'Admit Cards')", _extract_result_list),
+}
+
+
+def main():
+    """
+    Interactive main function that prompts user for URL and extraction options.
+    """
+    sys.stdout.write(_banner("WEB SCRAPER - Interactive Mode"))
+    
+    # Get URL from user
+    url = input("\nEnter the URL to scrape: ").strip()
+    if not url:
+        print("Error: URL cannot be empty!")
+        return
+    
+    # Add https:// if not present
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    # Ask what to extract and run it
+    _run_menu(url, "What would you like to extract?", _MAIN_ACTIONS,
+              invalid_message="Invalid choice! Please run the script again and select 1-6.")
 
 
 if __name__ == "__main__":